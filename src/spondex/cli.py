@@ -400,6 +400,7 @@ def config_show() -> None:
     console.print(f"  interval_minutes = {cfg.sync.interval_minutes}")
     console.print(f"  mode             = {cfg.sync.mode}")
     console.print(f"  propagate_deletions = {cfg.sync.propagate_deletions}")
+    console.print(f"  spotify_requests_per_window = {cfg.sync.spotify_requests_per_window}")
 
     console.print("\n[bold cyan]\\[spotify][/bold cyan]")
     console.print(f"  client_id      = {cfg.spotify.client_id or '[dim](not set)[/dim]'}")
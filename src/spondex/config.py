@@ -19,6 +19,7 @@ _CONFIG_FILE = "config.toml"
 _PID_FILE = "daemon.pid"
 _SOCKET_FILE = "daemon.sock"
 _LOG_DIR = "logs"
+_TOKEN_CACHE_FILE = "token_cache.json"  # noqa: S105
 
 
 def get_base_dir() -> Path:
@@ -50,6 +51,11 @@ class SyncConfig(BaseModel):
         default=True,
         description="Mirror removals: if a track is unliked on one side, unlike on the other",
     )
+    spotify_requests_per_window: int = Field(
+        default=0,
+        ge=0,
+        description="Max Spotify requests started per rolling 30s window (0 = no proactive pacing)",
+    )
 
 
 class SpotifyConfig(BaseModel):
@@ -93,6 +99,10 @@ class AppConfig(BaseModel):
     def log_dir(self) -> Path:
         return self.base_dir / _LOG_DIR
 
+    @property
+    def token_cache_path(self) -> Path:
+        return self.base_dir / _TOKEN_CACHE_FILE
+
     def is_spotify_configured(self) -> bool:
         """Return True if Spotify credentials are fully set."""
         return bool(
@@ -128,12 +138,20 @@ def config_exists() -> bool:
 # ---------------------------------------------------------------------------
 
 
-def check_config_permissions() -> str | None:
-    """Check config file permissions and return a warning if too open."""
+def check_config_permissions(st: os.stat_result | None = None) -> str | None:
+    """Check config file permissions and return a warning if too open.
+
+    *st* lets a caller that has already stat'ed the config file reuse it.
+    """
     path = get_base_dir() / _CONFIG_FILE
-    if not path.is_file():
+    if st is None:
+        try:
+            st = os.stat(path)
+        except FileNotFoundError:
+            return None
+    if not stat.S_ISREG(st.st_mode):
         return None
-    mode = os.stat(path).st_mode
+    mode = st.st_mode
     if mode & (stat.S_IRWXG | stat.S_IRWXO):
         return (
             f"Config file {path} has overly permissive permissions "
@@ -147,14 +165,18 @@ def load_config() -> AppConfig:
     """Load configuration from TOML, falling back to defaults if the file is missing."""
     import warnings
 
-    warning = check_config_permissions()
-    if warning:
-        warnings.warn(warning, stacklevel=2)
-
     path = get_base_dir() / _CONFIG_FILE
-    if not path.is_file():
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return AppConfig()
+    if not stat.S_ISREG(st.st_mode):
         return AppConfig()
 
+    warning = check_config_permissions(st)
+    if warning:
+        warnings.warn(warning, stacklevel=2)
+
     with open(path, "rb") as f:
         raw = tomllib.load(f)
 
@@ -310,6 +310,7 @@ class Daemon:
 
         # Stop scheduler (waits for in-progress sync).
         await scheduler.stop()
+        await engine.aclose()
 
         rpc_server.should_exit = True
         dashboard_server.should_exit = True
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import asyncio
 import contextlib
+import time
 from datetime import UTC, datetime
 from typing import TYPE_CHECKING
 
@@ -49,6 +50,7 @@ class DaemonState:
 
     def __init__(self) -> None:
         self.started_at: datetime = datetime.now(UTC)
+        self._started_mono = time.monotonic()  # wall-clock jumps can't skew uptime
         self.shutdown_event: asyncio.Event = asyncio.Event()
         self.engine: SyncEngine | None = None
         self.scheduler: SyncScheduler | None = None
@@ -56,11 +58,14 @@ class DaemonState:
 
     # -- queries ------------------------------------------------------------
 
+    def uptime_seconds(self) -> float:
+        """Seconds since the daemon started, rounded to centiseconds."""
+        return round(time.monotonic() - self._started_mono, 2)
+
     def get_status(self) -> dict:
         """Return a snapshot of the current daemon status."""
-        uptime = (datetime.now(UTC) - self.started_at).total_seconds()
         status: dict = {
-            "uptime_seconds": round(uptime, 2),
+            "uptime_seconds": self.uptime_seconds(),
             "started_at": self.started_at.isoformat(),
         }
         if self.engine:
@@ -101,8 +106,7 @@ async def _dispatch(cmd: str, params: dict, state: DaemonState) -> RpcResponse:
         return RpcResponse(data=data)
 
     if cmd == "health":
-        uptime = (datetime.now(UTC) - state.started_at).total_seconds()
-        return RpcResponse(data={"uptime_seconds": round(uptime, 2)})
+        return RpcResponse(data={"uptime_seconds": state.uptime_seconds()})
 
     if cmd == "shutdown":
         state.request_shutdown()
@@ -149,7 +153,6 @@ def create_rpc_app(state: DaemonState) -> FastAPI:
 
     @app.get("/health", response_model=RpcResponse)
     async def health_endpoint() -> RpcResponse:
-        uptime = (datetime.now(UTC) - state.started_at).total_seconds()
-        return RpcResponse(data={"uptime_seconds": round(uptime, 2)})
+        return RpcResponse(data={"uptime_seconds": state.uptime_seconds()})
 
     return app
@@ -1,6 +1,6 @@
 """Spondex storage layer — async SQLite database for track mappings and sync state."""
 
-from spondex.storage.database import Database
+from spondex.storage.database import Database, FullSyncState
 from spondex.storage.models import (
     Collection,
     CollectionTrack,
@@ -13,6 +13,7 @@ __all__ = [
     "Collection",
     "CollectionTrack",
     "Database",
+    "FullSyncState",
     "SyncRun",
     "TrackMapping",
     "Unmatched",
@@ -2,7 +2,11 @@
 
 from __future__ import annotations
 
+import asyncio
 import contextlib
+from collections.abc import AsyncIterator
+from contextvars import ContextVar
+from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from pathlib import Path
 
@@ -89,12 +93,27 @@ def _now_iso() -> str:
     return datetime.now(UTC).isoformat()
 
 
+@dataclass(slots=True)
+class FullSyncState:
+    """Active contents of the paired liked collections, indexed for a full sync."""
+
+    sp_id_to_mapping: dict[str, TrackMapping] = field(default_factory=dict)
+    ym_id_to_mapping: dict[str, TrackMapping] = field(default_factory=dict)
+    # remote id → mapping, restricted to tracks active in that service's collection
+    sp_collection: dict[str, TrackMapping] = field(default_factory=dict)
+    ym_collection: dict[str, TrackMapping] = field(default_factory=dict)
+
+
 class Database:
     """Async SQLite database wrapper for Spondex."""
 
     def __init__(self, path: Path) -> None:
         self.path = path
         self._conn: aiosqlite.Connection | None = None
+        # Transaction nesting of the *current task* (and tasks it spawns);
+        # other tasks see 0 and wait on _tx_lock instead of joining.
+        self._tx_depth: ContextVar[int] = ContextVar(f"spondex_tx_depth_{id(self)}", default=0)
+        self._tx_lock = asyncio.Lock()
 
     @property
     def conn(self) -> aiosqlite.Connection:
@@ -107,6 +126,7 @@ class Database:
         self._conn = await aiosqlite.connect(self.path)
         self._conn.row_factory = aiosqlite.Row
         await self._conn.execute("PRAGMA journal_mode=WAL")
+        await self._conn.execute("PRAGMA synchronous=NORMAL")
         await self._conn.execute("PRAGMA foreign_keys=ON")
         await self._conn.executescript(_SCHEMA)
         await self._conn.commit()
@@ -116,6 +136,72 @@ class Database:
             await self._conn.close()
             self._conn = None
 
+    # -- transactions ---------------------------------------------------------
+
+    @contextlib.asynccontextmanager
+    async def transaction(self) -> AsyncIterator[None]:
+        """Group writes into a single transaction.
+
+        Methods called inside the block skip their own per-call commit; the
+        whole block is committed on exit or rolled back on error.  Nested
+        blocks become SAVEPOINTs, so an inner failure only undoes the inner
+        block.
+
+        The transaction belongs to the task that opened it (and tasks it
+        spawns).  Writes from any other task wait until it has finished
+        rather than silently joining it.
+        """
+        depth = self._tx_depth.get()
+        savepoint = f"sp_{depth}"
+        if depth == 0:
+            await self._tx_lock.acquire()
+            try:
+                await self.conn.execute("BEGIN")
+            except BaseException:
+                self._tx_lock.release()
+                raise
+        else:
+            await self.conn.execute(f"SAVEPOINT {savepoint}")
+        token = self._tx_depth.set(depth + 1)
+        try:
+            try:
+                yield
+            except BaseException:
+                self._tx_depth.reset(token)
+                if depth == 0:
+                    await self.conn.rollback()
+                else:
+                    await self.conn.execute(f"ROLLBACK TO {savepoint}")
+                    await self.conn.execute(f"RELEASE {savepoint}")
+                raise
+            self._tx_depth.reset(token)
+            if depth == 0:
+                await self.conn.commit()
+            else:
+                await self.conn.execute(f"RELEASE {savepoint}")
+        finally:
+            if depth == 0:
+                self._tx_lock.release()
+
+    @contextlib.asynccontextmanager
+    async def _write(self) -> AsyncIterator[None]:
+        """Run one write method's statements.
+
+        Inside this task's :meth:`transaction` the write simply joins it;
+        otherwise it waits for any other task's transaction and commits (or,
+        on error, rolls back) on its own.
+        """
+        if self._tx_depth.get():
+            yield
+            return
+        async with self._tx_lock:
+            try:
+                yield
+            except BaseException:
+                await self.conn.rollback()
+                raise
+            await self.conn.commit()
+
     # -- track_mapping --------------------------------------------------------
 
     async def upsert_track_mapping(
@@ -128,28 +214,29 @@ class Database:
         match_confidence: float = 1.0,
     ) -> TrackMapping:
         now = _now_iso()
-        cur = await self.conn.execute(
-            """
-            INSERT INTO track_mapping (spotify_id, yandex_id, artist, title, match_confidence, created_at, updated_at)
-            VALUES (?, ?, ?, ?, ?, ?, ?)
-            ON CONFLICT (spotify_id) DO UPDATE SET
-                yandex_id = COALESCE(excluded.yandex_id, track_mapping.yandex_id),
-                artist = excluded.artist,
-                title = excluded.title,
-                match_confidence = excluded.match_confidence,
-                updated_at = excluded.updated_at
-            ON CONFLICT (yandex_id) DO UPDATE SET
-                spotify_id = COALESCE(excluded.spotify_id, track_mapping.spotify_id),
-                artist = excluded.artist,
-                title = excluded.title,
-                match_confidence = excluded.match_confidence,
-                updated_at = excluded.updated_at
-            RETURNING *
-            """,
-            (spotify_id, yandex_id, artist, title, match_confidence, now, now),
-        )
-        row = await cur.fetchone()
-        await self.conn.commit()
+        async with self._write():
+            cur = await self.conn.execute(
+                """
+                INSERT INTO track_mapping
+                    (spotify_id, yandex_id, artist, title, match_confidence, created_at, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT (spotify_id) DO UPDATE SET
+                    yandex_id = COALESCE(excluded.yandex_id, track_mapping.yandex_id),
+                    artist = excluded.artist,
+                    title = excluded.title,
+                    match_confidence = excluded.match_confidence,
+                    updated_at = excluded.updated_at
+                ON CONFLICT (yandex_id) DO UPDATE SET
+                    spotify_id = COALESCE(excluded.spotify_id, track_mapping.spotify_id),
+                    artist = excluded.artist,
+                    title = excluded.title,
+                    match_confidence = excluded.match_confidence,
+                    updated_at = excluded.updated_at
+                RETURNING *
+                """,
+                (spotify_id, yandex_id, artist, title, match_confidence, now, now),
+            )
+            row = await cur.fetchone()
         return self._row_to_track_mapping(row)
 
     async def get_track_mapping_by_id(self, mapping_id: int) -> TrackMapping | None:
@@ -173,8 +260,7 @@ class Database:
         return self._row_to_track_mapping(row) if row else None
 
     async def list_track_mappings(self) -> list[TrackMapping]:
-        cur = await self.conn.execute("SELECT * FROM track_mapping ORDER BY id")
-        rows = await cur.fetchall()
+        rows = await self.conn.execute_fetchall("SELECT * FROM track_mapping ORDER BY id")
         return [self._row_to_track_mapping(r) for r in rows]
 
     # -- collection -----------------------------------------------------------
@@ -188,16 +274,16 @@ class Database:
         remote_id: str | None = None,
         paired_id: int | None = None,
     ) -> Collection:
-        cur = await self.conn.execute(
-            """
-            INSERT INTO collection (service, collection_type, remote_id, title, paired_id)
-            VALUES (?, ?, ?, ?, ?)
-            RETURNING *
-            """,
-            (service, collection_type, remote_id, title, paired_id),
-        )
-        row = await cur.fetchone()
-        await self.conn.commit()
+        async with self._write():
+            cur = await self.conn.execute(
+                """
+                INSERT INTO collection (service, collection_type, remote_id, title, paired_id)
+                VALUES (?, ?, ?, ?, ?)
+                RETURNING *
+                """,
+                (service, collection_type, remote_id, title, paired_id),
+            )
+            row = await cur.fetchone()
         return self._row_to_collection(row)
 
     async def get_collection(self, collection_id: int) -> Collection | None:
@@ -227,16 +313,17 @@ class Database:
 
     async def list_collections(self, service: str | None = None) -> list[Collection]:
         if service:
-            cur = await self.conn.execute("SELECT * FROM collection WHERE service = ? ORDER BY id", (service,))
+            rows = await self.conn.execute_fetchall(
+                "SELECT * FROM collection WHERE service = ? ORDER BY id", (service,)
+            )
         else:
-            cur = await self.conn.execute("SELECT * FROM collection ORDER BY id")
-        rows = await cur.fetchall()
+            rows = await self.conn.execute_fetchall("SELECT * FROM collection ORDER BY id")
         return [self._row_to_collection(r) for r in rows]
 
     async def pair_collections(self, id_a: int, id_b: int) -> None:
-        await self.conn.execute("UPDATE collection SET paired_id = ? WHERE id = ?", (id_b, id_a))
-        await self.conn.execute("UPDATE collection SET paired_id = ? WHERE id = ?", (id_a, id_b))
-        await self.conn.commit()
+        async with self._write():
+            await self.conn.execute("UPDATE collection SET paired_id = ? WHERE id = ?", (id_b, id_a))
+            await self.conn.execute("UPDATE collection SET paired_id = ? WHERE id = ?", (id_a, id_b))
 
     # -- collection_track -----------------------------------------------------
 
@@ -249,29 +336,29 @@ class Database:
         added_at: str | None = None,
     ) -> CollectionTrack:
         now = _now_iso()
-        cur = await self.conn.execute(
-            """
-            INSERT INTO collection_track (collection_id, track_mapping_id, position, added_at, synced_at)
-            VALUES (?, ?, ?, ?, ?)
-            ON CONFLICT (collection_id, track_mapping_id) DO UPDATE SET
-                position = excluded.position,
-                synced_at = excluded.synced_at,
-                removed_at = NULL
-            RETURNING *
-            """,
-            (collection_id, track_mapping_id, position, added_at, now),
-        )
-        row = await cur.fetchone()
-        await self.conn.commit()
+        async with self._write():
+            cur = await self.conn.execute(
+                """
+                INSERT INTO collection_track (collection_id, track_mapping_id, position, added_at, synced_at)
+                VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT (collection_id, track_mapping_id) DO UPDATE SET
+                    position = excluded.position,
+                    synced_at = excluded.synced_at,
+                    removed_at = NULL
+                RETURNING *
+                """,
+                (collection_id, track_mapping_id, position, added_at, now),
+            )
+            row = await cur.fetchone()
         return self._row_to_collection_track(row)
 
     async def mark_track_removed(self, *, collection_id: int, track_mapping_id: int) -> None:
         now = _now_iso()
-        await self.conn.execute(
-            "UPDATE collection_track SET removed_at = ? WHERE collection_id = ? AND track_mapping_id = ?",
-            (now, collection_id, track_mapping_id),
-        )
-        await self.conn.commit()
+        async with self._write():
+            await self.conn.execute(
+                "UPDATE collection_track SET removed_at = ? WHERE collection_id = ? AND track_mapping_id = ?",
+                (now, collection_id, track_mapping_id),
+            )
 
     async def list_collection_tracks(
         self,
@@ -280,24 +367,23 @@ class Database:
         include_removed: bool = False,
     ) -> list[CollectionTrack]:
         if include_removed:
-            cur = await self.conn.execute(
+            rows = await self.conn.execute_fetchall(
                 "SELECT * FROM collection_track WHERE collection_id = ? ORDER BY position",
                 (collection_id,),
             )
         else:
-            cur = await self.conn.execute(
+            rows = await self.conn.execute_fetchall(
                 "SELECT * FROM collection_track WHERE collection_id = ? AND removed_at IS NULL ORDER BY position",
                 (collection_id,),
             )
-        rows = await cur.fetchall()
         return [self._row_to_collection_track(r) for r in rows]
 
     async def delete_removed_tracks(self, collection_id: int) -> int:
-        cur = await self.conn.execute(
-            "DELETE FROM collection_track WHERE collection_id = ? AND removed_at IS NOT NULL",
-            (collection_id,),
-        )
-        await self.conn.commit()
+        async with self._write():
+            cur = await self.conn.execute(
+                "DELETE FROM collection_track WHERE collection_id = ? AND removed_at IS NOT NULL",
+                (collection_id,),
+            )
         return cur.rowcount
 
     # -- unmatched ------------------------------------------------------------
@@ -311,37 +397,36 @@ class Database:
         title: str,
     ) -> Unmatched:
         now = _now_iso()
-        cur = await self.conn.execute(
-            """
-            INSERT INTO unmatched (source_service, source_id, artist, title, last_attempt_at, created_at)
-            VALUES (?, ?, ?, ?, ?, ?)
-            ON CONFLICT (source_service, source_id) DO UPDATE SET
-                attempts = unmatched.attempts + 1,
-                last_attempt_at = excluded.last_attempt_at
-            RETURNING *
-            """,
-            (source_service, source_id, artist, title, now, now),
-        )
-        row = await cur.fetchone()
-        await self.conn.commit()
+        async with self._write():
+            cur = await self.conn.execute(
+                """
+                INSERT INTO unmatched (source_service, source_id, artist, title, last_attempt_at, created_at)
+                VALUES (?, ?, ?, ?, ?, ?)
+                ON CONFLICT (source_service, source_id) DO UPDATE SET
+                    attempts = unmatched.attempts + 1,
+                    last_attempt_at = excluded.last_attempt_at
+                RETURNING *
+                """,
+                (source_service, source_id, artist, title, now, now),
+            )
+            row = await cur.fetchone()
         return self._row_to_unmatched(row)
 
     async def resolve_unmatched(self, source_service: str, source_id: str) -> None:
-        await self.conn.execute(
-            "DELETE FROM unmatched WHERE source_service = ? AND source_id = ?",
-            (source_service, source_id),
-        )
-        await self.conn.commit()
+        async with self._write():
+            await self.conn.execute(
+                "DELETE FROM unmatched WHERE source_service = ? AND source_id = ?",
+                (source_service, source_id),
+            )
 
     async def list_unmatched(self, source_service: str | None = None) -> list[Unmatched]:
         if source_service:
-            cur = await self.conn.execute(
+            rows = await self.conn.execute_fetchall(
                 "SELECT * FROM unmatched WHERE source_service = ? ORDER BY id",
                 (source_service,),
             )
         else:
-            cur = await self.conn.execute("SELECT * FROM unmatched ORDER BY id")
-        rows = await cur.fetchall()
+            rows = await self.conn.execute_fetchall("SELECT * FROM unmatched ORDER BY id")
         return [self._row_to_unmatched(r) for r in rows]
 
     # -- sync_runs ------------------------------------------------------------
@@ -354,16 +439,16 @@ class Database:
         collection_id: int | None = None,
     ) -> SyncRun:
         now = _now_iso()
-        cur = await self.conn.execute(
-            """
-            INSERT INTO sync_runs (started_at, collection_id, direction, mode, status)
-            VALUES (?, ?, ?, ?, 'running')
-            RETURNING *
-            """,
-            (now, collection_id, direction, mode),
-        )
-        row = await cur.fetchone()
-        await self.conn.commit()
+        async with self._write():
+            cur = await self.conn.execute(
+                """
+                INSERT INTO sync_runs (started_at, collection_id, direction, mode, status)
+                VALUES (?, ?, ?, ?, 'running')
+                RETURNING *
+                """,
+                (now, collection_id, direction, mode),
+            )
+            row = await cur.fetchone()
         return self._row_to_sync_run(row)
 
     async def finish_sync_run(
@@ -375,21 +460,20 @@ class Database:
         error_message: str | None = None,
     ) -> SyncRun:
         now = _now_iso()
-        cur = await self.conn.execute(
-            """
-            UPDATE sync_runs SET finished_at = ?, status = ?, stats_json = ?, error_message = ?
-            WHERE id = ?
-            RETURNING *
-            """,
-            (now, status, stats_json, error_message, run_id),
-        )
-        row = await cur.fetchone()
-        await self.conn.commit()
+        async with self._write():
+            cur = await self.conn.execute(
+                """
+                UPDATE sync_runs SET finished_at = ?, status = ?, stats_json = ?, error_message = ?
+                WHERE id = ?
+                RETURNING *
+                """,
+                (now, status, stats_json, error_message, run_id),
+            )
+            row = await cur.fetchone()
         return self._row_to_sync_run(row)
 
     async def list_sync_runs(self, *, limit: int = 20) -> list[SyncRun]:
-        cur = await self.conn.execute("SELECT * FROM sync_runs ORDER BY id DESC LIMIT ?", (limit,))
-        rows = await cur.fetchall()
+        rows = await self.conn.execute_fetchall("SELECT * FROM sync_runs ORDER BY id DESC LIMIT ?", (limit,))
         return [self._row_to_sync_run(r) for r in rows]
 
     async def get_last_successful_sync(self) -> SyncRun | None:
@@ -435,36 +519,33 @@ class Database:
     ) -> list[TrackMapping]:
         if search:
             like = f"%{search}%"
-            cur = await self.conn.execute(
+            rows = await self.conn.execute_fetchall(
                 "SELECT * FROM track_mapping WHERE artist LIKE ? OR title LIKE ? ORDER BY id DESC LIMIT ? OFFSET ?",
                 (like, like, limit, offset),
             )
         else:
-            cur = await self.conn.execute(
+            rows = await self.conn.execute_fetchall(
                 "SELECT * FROM track_mapping ORDER BY id DESC LIMIT ? OFFSET ?",
                 (limit, offset),
             )
-        rows = await cur.fetchall()
         return [self._row_to_track_mapping(r) for r in rows]
 
     async def list_unmatched_paginated(self, limit: int = 50, offset: int = 0) -> list[Unmatched]:
-        cur = await self.conn.execute(
+        rows = await self.conn.execute_fetchall(
             "SELECT * FROM unmatched ORDER BY id DESC LIMIT ? OFFSET ?",
             (limit, offset),
         )
-        rows = await cur.fetchall()
         return [self._row_to_unmatched(r) for r in rows]
 
     async def list_sync_runs_paginated(self, limit: int = 20, offset: int = 0) -> list[SyncRun]:
-        cur = await self.conn.execute(
+        rows = await self.conn.execute_fetchall(
             "SELECT * FROM sync_runs ORDER BY id DESC LIMIT ? OFFSET ?",
             (limit, offset),
         )
-        rows = await cur.fetchall()
         return [self._row_to_sync_run(r) for r in rows]
 
     async def list_collections_with_counts(self) -> list[dict]:
-        cur = await self.conn.execute(
+        rows = await self.conn.execute_fetchall(
             """
             SELECT c.*, COUNT(ct.track_mapping_id) as track_count
             FROM collection c
@@ -473,7 +554,6 @@ class Database:
             ORDER BY c.id
             """
         )
-        rows = await cur.fetchall()
         return [
             {
                 **self._row_to_collection(r).model_dump(),
@@ -484,17 +564,35 @@ class Database:
 
     # -- batch helpers --------------------------------------------------------
 
-    async def get_track_mappings_by_ids(self, mapping_ids: list[int]) -> dict[int, TrackMapping]:
-        """Fetch multiple track mappings by ID in a single query."""
-        if not mapping_ids:
-            return {}
-        placeholders = ",".join("?" * len(mapping_ids))
-        cur = await self.conn.execute(
-            f"SELECT * FROM track_mapping WHERE id IN ({placeholders})",  # noqa: S608
-            mapping_ids,
+    async def load_full_sync_state(self, sp_col_id: int, ym_col_id: int) -> FullSyncState:
+        """Load active tracks of both liked collections with their mappings in a single query."""
+        rows = await self.conn.execute_fetchall(
+            """
+            SELECT m.*, ct.collection_id
+            FROM track_mapping m
+            JOIN collection_track ct ON ct.track_mapping_id = m.id
+            WHERE ct.collection_id IN (?, ?) AND ct.removed_at IS NULL
+            """,
+            (sp_col_id, ym_col_id),
         )
-        rows = await cur.fetchall()
-        return {row["id"]: self._row_to_track_mapping(row) for row in rows}
+
+        state = FullSyncState()
+        # A mapping in both collections comes back twice; build it once.
+        mappings: dict[int, TrackMapping] = {}
+        for row in rows:
+            mapping = mappings.get(row["id"])
+            if mapping is None:
+                mapping = mappings[row["id"]] = self._row_to_track_mapping(row)
+                if mapping.spotify_id:
+                    state.sp_id_to_mapping[mapping.spotify_id] = mapping
+                if mapping.yandex_id:
+                    state.ym_id_to_mapping[mapping.yandex_id] = mapping
+            if row["collection_id"] == sp_col_id:
+                if mapping.spotify_id:
+                    state.sp_collection[mapping.spotify_id] = mapping
+            elif mapping.yandex_id:
+                state.ym_collection[mapping.yandex_id] = mapping
+        return state
 
     # -- row → model helpers --------------------------------------------------
 
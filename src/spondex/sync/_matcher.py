@@ -0,0 +1,79 @@
+"""Search-result validation: does a found track really match the query?"""
+
+from __future__ import annotations
+
+from difflib import SequenceMatcher
+
+from spondex.sync.differ import normalize, transliterate
+
+FUZZY_THRESHOLD = 0.8
+DURATION_TOLERANCE_MS = 1000  # ±1 second
+
+
+def _contains(a: str, b: str) -> bool:
+    return a == b or a in b or b in a
+
+
+def _fuzzy(a: str, b: str) -> float:
+    return SequenceMatcher(None, a, b).ratio()
+
+
+def is_good_match(
+    query_artist: str,
+    query_title: str,
+    found_artist: str,
+    found_title: str,
+    *,
+    query_duration_ms: int | None = None,
+    found_duration_ms: int | None = None,
+) -> bool:
+    """Validate that a search result actually matches the query.
+
+    Matching tiers (in order):
+    1. Normalized exact/contains — accept immediately
+    2. Transliterated exact/contains — accept immediately
+    3. Fuzzy match (SequenceMatcher ratio >= 0.8) — accept, but if
+       both tracks have duration and it differs by more than ±1s, reject
+    """
+    q_artist = normalize(query_artist)
+    q_title = normalize(query_title)
+    f_artist = normalize(found_artist)
+    f_title = normalize(found_title)
+
+    # Tier 1: direct normalized comparison
+    title_ok = _contains(q_title, f_title)
+    artist_ok = _contains(q_artist, f_artist)
+    if title_ok and artist_ok:
+        return True
+
+    # Tier 2: transliterated comparison
+    qt_artist = transliterate(q_artist)
+    ft_artist = transliterate(f_artist)
+    qt_title = transliterate(q_title)
+    ft_title = transliterate(f_title)
+
+    t_artist_ok = artist_ok or _contains(qt_artist, ft_artist)
+    t_title_ok = title_ok or _contains(qt_title, ft_title)
+    if t_artist_ok and t_title_ok:
+        return True
+
+    # Tier 3: fuzzy matching with duration validation
+    fuzzy_artist = max(
+        _fuzzy(q_artist, f_artist),
+        _fuzzy(qt_artist, ft_artist),
+    )
+    fuzzy_title = max(
+        _fuzzy(q_title, f_title),
+        _fuzzy(qt_title, ft_title),
+    )
+
+    # Both artist and title must pass fuzzy threshold
+    if fuzzy_artist < FUZZY_THRESHOLD or fuzzy_title < FUZZY_THRESHOLD:
+        return False
+
+    # Duration veto: if both known, must be within tolerance
+    return not (
+        query_duration_ms is not None
+        and found_duration_ms is not None
+        and abs(query_duration_ms - found_duration_ms) > DURATION_TOLERANCE_MS
+    )
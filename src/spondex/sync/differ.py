@@ -2,12 +2,13 @@
 
 from __future__ import annotations
 
+import functools
 import re
 import unicodedata
 from dataclasses import dataclass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RemoteTrack:
     """A track as fetched from a remote service API."""
 
@@ -18,8 +19,13 @@ class RemoteTrack:
     added_at: str | None = None  # ISO timestamp when liked
     duration_ms: int | None = None  # track duration in milliseconds
 
+    def __post_init__(self) -> None:
+        # APIs may hand back numeric IDs; keep them uniformly str for hashing
+        if not isinstance(self.remote_id, str):
+            object.__setattr__(self, "remote_id", str(self.remote_id))
 
-@dataclass
+
+@dataclass(slots=True)
 class MatchResult:
     """Result of cross-matching two RemoteTracks."""
 
@@ -73,41 +79,44 @@ def transliterate(text: str) -> str:
     return "".join(result)
 
 
+_FEAT_PAREN_RE = re.compile(r"\s*[\(\[](feat\.?|ft\.?|featuring)\s+[^\)\]]*[\)\]]", re.IGNORECASE)
+_FEAT_INLINE_RE = re.compile(r"\s+(feat\.?|ft\.?|featuring)\s+.*$", re.IGNORECASE)
+_PAREN_RE = re.compile(r"\s*[\(\[][^\)\]]*[\)\]]")
+_PUNCT_RE = re.compile(r"[^\w\s]")
+_SPACE_RE = re.compile(r"\s+")
+
+
+@functools.lru_cache(maxsize=8192)
 def normalize(text: str) -> str:
     """Normalize a track title or artist name for matching.
 
     Steps:
-    1. Unicode NFKD normalization
+    1. Unicode NFKD normalization (skipped for pure-ASCII input, where it
+       is a no-op)
     2. Lowercase
     3. Remove feat./ft./featuring clauses (both in parens and inline)
     4. Remove content in parentheses/brackets (remix indicators etc)
     5. Strip punctuation except spaces
     6. Collapse whitespace
+
+    Results are memoized: the same artist and title strings are normalized
+    again and again across cross-matching and search validation.
     """
     # NFKD
-    text = unicodedata.normalize("NFKD", text)
+    if not text.isascii():
+        text = unicodedata.normalize("NFKD", text)
     # Lowercase
     text = text.lower()
     # Remove feat/ft/featuring in parens/brackets
-    text = re.sub(
-        r"\s*[\(\[](feat\.?|ft\.?|featuring)\s+[^\)\]]*[\)\]]",
-        "",
-        text,
-        flags=re.IGNORECASE,
-    )
+    text = _FEAT_PAREN_RE.sub("", text)
     # Remove inline feat/ft/featuring and everything after
-    text = re.sub(
-        r"\s+(feat\.?|ft\.?|featuring)\s+.*$",
-        "",
-        text,
-        flags=re.IGNORECASE,
-    )
+    text = _FEAT_INLINE_RE.sub("", text)
     # Remove all remaining parenthetical/bracket content
-    text = re.sub(r"\s*[\(\[][^\)\]]*[\)\]]", "", text)
+    text = _PAREN_RE.sub("", text)
     # Strip punctuation (keep letters, digits, spaces)
-    text = re.sub(r"[^\w\s]", "", text)
+    text = _PUNCT_RE.sub("", text)
     # Collapse whitespace
-    text = re.sub(r"\s+", " ", text).strip()
+    text = _SPACE_RE.sub(" ", text).strip()
     return text
 
 
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import asyncio
 import json
+import unicodedata
 from dataclasses import dataclass
 from datetime import datetime
 from enum import StrEnum
@@ -11,18 +12,28 @@ from typing import TYPE_CHECKING
 
 import structlog
 
-from spondex.sync.differ import cross_match, normalize, transliterate
+from spondex.sync._matcher import is_good_match
+from spondex.sync.differ import cross_match
+from spondex.sync.ratelimit import RateLimiter
 
 if TYPE_CHECKING:
+    import httpx
+
     from spondex.config import AppConfig
     from spondex.storage.database import Database
     from spondex.storage.models import SyncMode
-    from spondex.sync.spotify import SpotifyClient
+    from spondex.sync.differ import RemoteTrack
+    from spondex.sync.spotify import PageCache, SpotifyClient
     from spondex.sync.yandex import YandexClient
 
 log = structlog.get_logger(__name__)
 
 _MAX_UNMATCHED_ATTEMPTS = 5
+_SEARCH_CONCURRENCY = 8
+
+
+def _search_key(text: str) -> str:
+    return unicodedata.normalize("NFKC", text).casefold().strip()
 
 
 class SyncState(StrEnum):
@@ -77,6 +88,18 @@ class SyncEngine:
         self._state = SyncState.IDLE
         self._lock = asyncio.Lock()
         self._last_stats: SyncStats | None = None
+        # One limiter per service, shared by every client and fan-out.
+        # Spotify pacing is opt-in; otherwise 429 Retry-After back-off applies.
+        self._sp_limiter = RateLimiter(max_per_window=config.sync.spotify_requests_per_window or None)
+        self._ym_limiter = RateLimiter()
+        # Spotify connection pool, reused across syncs; see aclose().
+        self._sp_http: httpx.AsyncClient | None = None
+        # /me/tracks pages by offset, revalidated with If-None-Match.
+        self._sp_page_cache: PageCache = {}
+        # Resolved by the first YandexClient.init(); lets later syncs skip it.
+        self._ym_account_uid: int | None = None
+        # Searches issued during the current run, keyed by (target, artist, title).
+        self._search_memo: dict[tuple[str, str, str], asyncio.Future[RemoteTrack | None]] = {}
 
     @property
     def state(self) -> SyncState:
@@ -92,15 +115,25 @@ class SyncEngine:
             "last_stats": self._last_stats.to_json() if self._last_stats else None,
         }
 
-    async def run_sync(self, mode: SyncMode | None = None) -> SyncStats:
-        """Run a sync cycle. Raises if already syncing."""
+    async def aclose(self) -> None:
+        """Close the shared Spotify connection pool, if one was opened."""
+        if self._sp_http is not None:
+            await self._sp_http.aclose()
+            self._sp_http = None
+
+    async def run_sync(self, mode: SyncMode | None = None, *, since: datetime | None = None) -> SyncStats:
+        """Run a sync cycle. Raises if already syncing.
+
+        *since* is the finish time of the last successful sync when the
+        caller already tracks it; otherwise it is looked up in the database.
+        """
         if self._lock.locked():
             raise RuntimeError("Sync already in progress")
 
         async with self._lock:
             self._state = SyncState.SYNCING
             try:
-                stats = await self._do_sync(mode)
+                stats = await self._do_sync(mode, since)
                 self._state = SyncState.IDLE
                 self._last_stats = stats
                 return stats
@@ -108,15 +141,23 @@ class SyncEngine:
                 self._state = SyncState.ERROR
                 raise
 
-    async def _do_sync(self, mode_override: SyncMode | None) -> SyncStats:
-        # Determine mode
-        last_run = await self._db.get_last_successful_sync()
-        if last_run is None:
-            effective_mode: SyncMode = "full"
-        elif mode_override:
-            effective_mode = mode_override
+    async def _do_sync(self, mode_override: SyncMode | None, since_override: datetime | None = None) -> SyncStats:
+        # Determine mode — the last successful run is only needed when the
+        # caller hasn't already chosen a full sync or supplied the window.
+        since = since_override
+        effective_mode: SyncMode
+        if mode_override == "full":
+            effective_mode = "full"
+        elif since_override is not None:
+            effective_mode = mode_override or self._config.sync.mode
         else:
-            effective_mode = self._config.sync.mode
+            last_run = await self._db.get_last_successful_sync()
+            if last_run is None:
+                effective_mode = "full"
+            else:
+                effective_mode = mode_override or self._config.sync.mode
+                if last_run.finished_at:
+                    since = datetime.fromisoformat(str(last_run.finished_at))
 
         log.info("sync_start", mode=effective_mode)
 
@@ -124,23 +165,23 @@ class SyncEngine:
         run = await self._db.start_sync_run(direction="bidirectional", mode=effective_mode)
 
         stats = SyncStats()
+        self._search_memo.clear()
         try:
             sp_client = self._create_sp_client()
             ym_client = self._create_ym_client()
 
             async with sp_client, ym_client:
+                self._ym_account_uid = getattr(ym_client, "account_uid", None)
                 # Ensure collections exist
                 sp_col, ym_col = await self._ensure_collections()
 
                 if effective_mode == "full":
                     await self._full_sync(sp_client, ym_client, sp_col.id, ym_col.id, stats)
                 else:
-                    since = (
-                        datetime.fromisoformat(str(last_run.finished_at)) if last_run and last_run.finished_at else None
-                    )
                     await self._incremental_sync(sp_client, ym_client, sp_col.id, ym_col.id, stats, since)
 
             await self._db.finish_sync_run(run.id, status="completed", stats_json=stats.to_json())
+
             log.info("sync_completed", stats=stats.to_json())
             return stats
 
@@ -152,16 +193,24 @@ class SyncEngine:
     def _create_sp_client(self) -> SpotifyClient:
         if self._sp_factory:
             return self._sp_factory(self._config.spotify)
-        from spondex.sync.spotify import SpotifyClient
-
-        return SpotifyClient(self._config.spotify)
+        from spondex.sync.spotify import SpotifyClient, create_http_client
+
+        if self._sp_http is None:
+            self._sp_http = create_http_client()
+        return SpotifyClient(
+            self._config.spotify,
+            limiter=self._sp_limiter,
+            http=self._sp_http,
+            token_cache=self._config.token_cache_path,
+            page_cache=self._sp_page_cache,
+        )
 
     def _create_ym_client(self) -> YandexClient:
         if self._ym_factory:
             return self._ym_factory(self._config.yandex)
         from spondex.sync.yandex import YandexClient
 
-        return YandexClient(self._config.yandex)
+        return YandexClient(self._config.yandex, limiter=self._ym_limiter, account_uid=self._ym_account_uid)
 
     async def _ensure_collections(self):
         """Ensure 'liked' collections exist for both services, paired together."""
@@ -184,73 +233,33 @@ class SyncEngine:
 
     async def _full_sync(self, sp, ym, sp_col_id, ym_col_id, stats):
         # 1. Fetch ALL tracks in parallel
-        sp_tracks, ym_tracks = await asyncio.gather(sp.get_liked_tracks(), ym.get_liked_tracks())
-
-        # 2. Load existing DB state
-        db_sp_tracks = await self._db.list_collection_tracks(sp_col_id)
-        db_ym_tracks = await self._db.list_collection_tracks(ym_col_id)
-
-        # Build indexes: remote_id → mapping_id for existing tracks
-        sp_mapping_ids = {ct.track_mapping_id for ct in db_sp_tracks}
-        ym_mapping_ids = {ct.track_mapping_id for ct in db_ym_tracks}
-
-        # Load all mappings for index building
-        all_mapping_ids = list(sp_mapping_ids | ym_mapping_ids)
-        mappings_by_id = await self._db.get_track_mappings_by_ids(all_mapping_ids)
-
-        # Build remote_id → mapping indexes
-        sp_id_to_mapping = {}
-        ym_id_to_mapping = {}
-        for m in mappings_by_id.values():
-            if m.spotify_id:
-                sp_id_to_mapping[m.spotify_id] = m
-            if m.yandex_id:
-                ym_id_to_mapping[m.yandex_id] = m
-
-        # Compute new and removed
-        remote_sp_ids = {t.remote_id for t in sp_tracks}
-        remote_ym_ids = {t.remote_id for t in ym_tracks}
-
-        sp_new = [t for t in sp_tracks if t.remote_id not in sp_id_to_mapping]
-        ym_new = [t for t in ym_tracks if t.remote_id not in ym_id_to_mapping]
-
-        sp_removed_mappings = [
-            m
-            for mid, m in mappings_by_id.items()
-            if mid in sp_mapping_ids and m.spotify_id and m.spotify_id not in remote_sp_ids
-        ]
-        ym_removed_mappings = [
-            m
-            for mid, m in mappings_by_id.items()
-            if mid in ym_mapping_ids and m.yandex_id and m.yandex_id not in remote_ym_ids
-        ]
+        sp_tracks, ym_tracks = await asyncio.gather(
+            sp.get_liked_tracks(), ym.get_liked_tracks(), return_exceptions=True
+        )
+        for result in (sp_tracks, ym_tracks):
+            if isinstance(result, BaseException):
+                raise result
+
+        # 2. Load existing DB state (both collections + their mappings in one query)
+        db_state = await self._db.load_full_sync_state(sp_col_id, ym_col_id)
+
+        # Compute new and removed via set algebra on remote ids
+        remote_sp_ids = frozenset(t.remote_id for t in sp_tracks)
+        remote_ym_ids = frozenset(t.remote_id for t in ym_tracks)
+
+        new_sp_ids = remote_sp_ids - db_state.sp_id_to_mapping.keys()
+        new_ym_ids = remote_ym_ids - db_state.ym_id_to_mapping.keys()
+        sp_new = [t for t in sp_tracks if t.remote_id in new_sp_ids]
+        ym_new = [t for t in ym_tracks if t.remote_id in new_ym_ids]
+
+        # Only tracks already in each collection can have been removed from it
+        sp_removed_mappings = [db_state.sp_collection[i] for i in db_state.sp_collection.keys() - remote_sp_ids]
+        ym_removed_mappings = [db_state.ym_collection[i] for i in db_state.ym_collection.keys() - remote_ym_ids]
 
         # 3. Cross-match new tracks
         matches, unmatched_sp, unmatched_ym = cross_match(sp_new, ym_new)
 
-        for match in matches:
-            try:
-                mapping = await self._db.upsert_track_mapping(
-                    artist=match.spotify_track.artist,
-                    title=match.spotify_track.title,
-                    spotify_id=match.spotify_track.remote_id,
-                    yandex_id=match.yandex_track.remote_id,
-                    match_confidence=match.confidence,
-                )
-                await self._db.add_track_to_collection(
-                    collection_id=sp_col_id,
-                    track_mapping_id=mapping.id,
-                    added_at=match.spotify_track.added_at,
-                )
-                await self._db.add_track_to_collection(
-                    collection_id=ym_col_id,
-                    track_mapping_id=mapping.id,
-                    added_at=match.yandex_track.added_at,
-                )
-                stats.cross_matched += 1
-            except Exception as exc:
-                log.warning("cross_match_error", error=str(exc))
-                stats.errors += 1
+        await self._record_matches(matches, sp_col_id, ym_col_id, stats)
 
         # 4. Propagate removals (if enabled)
         if self._config.sync.propagate_deletions:
@@ -299,39 +308,21 @@ class SyncEngine:
         sp_tracks, ym_tracks = await asyncio.gather(
             sp.get_liked_tracks(since=since),
             ym.get_liked_tracks(since=since),
+            return_exceptions=True,
         )
+        for result in (sp_tracks, ym_tracks):
+            if isinstance(result, BaseException):
+                raise result
 
         # 2. Cross-match
         matches, unmatched_sp, unmatched_ym = cross_match(sp_tracks, ym_tracks)
 
-        for match in matches:
-            try:
-                mapping = await self._db.upsert_track_mapping(
-                    artist=match.spotify_track.artist,
-                    title=match.spotify_track.title,
-                    spotify_id=match.spotify_track.remote_id,
-                    yandex_id=match.yandex_track.remote_id,
-                    match_confidence=match.confidence,
-                )
-                await self._db.add_track_to_collection(
-                    collection_id=sp_col_id,
-                    track_mapping_id=mapping.id,
-                    added_at=match.spotify_track.added_at,
-                )
-                await self._db.add_track_to_collection(
-                    collection_id=ym_col_id,
-                    track_mapping_id=mapping.id,
-                    added_at=match.yandex_track.added_at,
-                )
-                stats.cross_matched += 1
-            except Exception as exc:
-                log.warning("cross_match_error", error=str(exc))
-                stats.errors += 1
+        await self._record_matches(matches, sp_col_id, ym_col_id, stats)
 
         # 3. Propagate additions only (no removals in incremental)
         # Build existing ID sets from fetched tracks (for dedup)
-        existing_sp = {t.remote_id for t in sp_tracks}
-        existing_ym = {t.remote_id for t in ym_tracks}
+        existing_sp = frozenset(t.remote_id for t in sp_tracks)
+        existing_ym = frozenset(t.remote_id for t in ym_tracks)
         await self._propagate_additions(
             sp,
             ym,
@@ -346,77 +337,47 @@ class SyncEngine:
 
     # ── SHARED HELPERS ─────────────────────────────────────────────────────
 
-    _FUZZY_THRESHOLD = 0.8
-    _DURATION_TOLERANCE_MS = 1000  # ±1 second
+    _is_good_match = staticmethod(is_good_match)
 
-    @staticmethod
-    def _is_good_match(
-        query_artist: str,
-        query_title: str,
-        found_artist: str,
-        found_title: str,
-        *,
-        query_duration_ms: int | None = None,
-        found_duration_ms: int | None = None,
-    ) -> bool:
-        """Validate that a search result actually matches the query.
-
-        Matching tiers (in order):
-        1. Normalized exact/contains — accept immediately
-        2. Transliterated exact/contains — accept immediately
-        3. Fuzzy match (SequenceMatcher ratio >= 0.8) — accept, but if
-           both tracks have duration and it differs by more than ±1s, reject
-        """
-        from difflib import SequenceMatcher
-
-        q_artist = normalize(query_artist)
-        q_title = normalize(query_title)
-        f_artist = normalize(found_artist)
-        f_title = normalize(found_title)
-
-        def _contains(a: str, b: str) -> bool:
-            return a == b or a in b or b in a
-
-        def _fuzzy(a: str, b: str) -> float:
-            return SequenceMatcher(None, a, b).ratio()
-
-        # Tier 1: direct normalized comparison
-        title_ok = _contains(q_title, f_title)
-        artist_ok = _contains(q_artist, f_artist)
-        if title_ok and artist_ok:
-            return True
-
-        # Tier 2: transliterated comparison
-        qt_artist = transliterate(q_artist)
-        ft_artist = transliterate(f_artist)
-        qt_title = transliterate(q_title)
-        ft_title = transliterate(f_title)
-
-        t_artist_ok = artist_ok or _contains(qt_artist, ft_artist)
-        t_title_ok = title_ok or _contains(qt_title, ft_title)
-        if t_artist_ok and t_title_ok:
-            return True
-
-        # Tier 3: fuzzy matching with duration validation
-        fuzzy_artist = max(
-            _fuzzy(q_artist, f_artist),
-            _fuzzy(qt_artist, ft_artist),
-        )
-        fuzzy_title = max(
-            _fuzzy(q_title, f_title),
-            _fuzzy(qt_title, ft_title),
-        )
+    async def _record_matches(self, matches, sp_col_id, ym_col_id, stats):
+        """Store cross-matched pairs in both collections.
 
-        # Both artist and title must pass fuzzy threshold
-        if fuzzy_artist < SyncEngine._FUZZY_THRESHOLD or fuzzy_title < SyncEngine._FUZZY_THRESHOLD:
-            return False
+        Purely local writes, so they share one commit; each pair gets its
+        own SAVEPOINT so a failing pair doesn't take the others with it.
+        """
+        async with self._db.transaction():
+            for match in matches:
+                try:
+                    async with self._db.transaction():
+                        mapping = await self._db.upsert_track_mapping(
+                            artist=match.spotify_track.artist,
+                            title=match.spotify_track.title,
+                            spotify_id=match.spotify_track.remote_id,
+                            yandex_id=match.yandex_track.remote_id,
+                            match_confidence=match.confidence,
+                        )
+                        await self._db.add_track_to_collection(
+                            collection_id=sp_col_id,
+                            track_mapping_id=mapping.id,
+                            added_at=match.spotify_track.added_at,
+                        )
+                        await self._db.add_track_to_collection(
+                            collection_id=ym_col_id,
+                            track_mapping_id=mapping.id,
+                            added_at=match.yandex_track.added_at,
+                        )
+                    stats.cross_matched += 1
+                except Exception as exc:
+                    log.warning("cross_match_error", error=str(exc))
+                    stats.errors += 1
 
-        # Duration veto: if both known, must be within tolerance
-        return not (
-            query_duration_ms is not None
-            and found_duration_ms is not None
-            and abs(query_duration_ms - found_duration_ms) > SyncEngine._DURATION_TOLERANCE_MS
-        )
+    def _search(self, client, target: str, artist: str, title: str) -> asyncio.Future[RemoteTrack | None]:
+        """Search *client*, sharing one request among identical queries in this run."""
+        key = (target, _search_key(artist), _search_key(title))
+        future = self._search_memo.get(key)
+        if future is None:
+            future = self._search_memo[key] = asyncio.ensure_future(client.search_track(artist, title))
+        return future
 
     async def _propagate_additions(
         self,
@@ -428,12 +389,13 @@ class SyncEngine:
         unmatched_ym,
         stats,
         *,
-        existing_sp_ids: set[str] | None = None,
-        existing_ym_ids: set[str] | None = None,
+        existing_sp_ids: frozenset[str] | None = None,
+        existing_ym_ids: frozenset[str] | None = None,
     ):
         """Propagate unmatched tracks: search on the other service and add."""
-        existing_sp_ids = existing_sp_ids or set()
-        existing_ym_ids = existing_ym_ids or set()
+        # Mutable copies: tracks added below count as existing for later ones
+        existing_sp_ids = set(existing_sp_ids or ())
+        existing_ym_ids = set(existing_ym_ids or ())
 
         # Spotify → Yandex
         for track in unmatched_sp:
@@ -443,13 +405,20 @@ class SyncEngine:
                     title=track.title,
                     spotify_id=track.remote_id,
                 )
-                await self._db.add_track_to_collection(
-                    collection_id=sp_col_id,
-                    track_mapping_id=mapping.id,
-                    added_at=track.added_at,
+                # Record the source track while searching the other service;
+                # both must settle before a failure is handled.
+                added, found = await asyncio.gather(
+                    self._db.add_track_to_collection(
+                        collection_id=sp_col_id,
+                        track_mapping_id=mapping.id,
+                        added_at=track.added_at,
+                    ),
+                    self._search(ym, "yandex", track.artist, track.title),
+                    return_exceptions=True,
                 )
-
-                found = await ym.search_track(track.artist, track.title)
+                for result in (added, found):
+                    if isinstance(result, Exception):
+                        raise result
                 if found and self._is_good_match(
                     track.artist,
                     track.title,
@@ -501,13 +470,20 @@ class SyncEngine:
                     title=track.title,
                     yandex_id=track.remote_id,
                 )
-                await self._db.add_track_to_collection(
-                    collection_id=ym_col_id,
-                    track_mapping_id=mapping.id,
-                    added_at=track.added_at,
+                # Record the source track while searching the other service;
+                # both must settle before a failure is handled.
+                added, found = await asyncio.gather(
+                    self._db.add_track_to_collection(
+                        collection_id=ym_col_id,
+                        track_mapping_id=mapping.id,
+                        added_at=track.added_at,
+                    ),
+                    self._search(sp, "spotify", track.artist, track.title),
+                    return_exceptions=True,
                 )
-
-                found = await sp.search_track(track.artist, track.title)
+                for result in (added, found):
+                    if isinstance(result, Exception):
+                        raise result
                 if found and self._is_good_match(
                     track.artist,
                     track.title,
@@ -552,44 +528,87 @@ class SyncEngine:
                 stats.errors += 1
 
     async def _retry_unmatched(self, sp, ym, sp_col_id, ym_col_id, stats):
-        """Retry previously unmatched tracks (full sync only)."""
-        for source_service, client, target_col_id, add_fn, _source_col_id in [
-            ("spotify", ym, ym_col_id, ym.like_tracks, sp_col_id),
-            ("yandex", sp, sp_col_id, sp.save_tracks, ym_col_id),
+        """Retry previously unmatched tracks (full sync only).
+
+        Searches for both services run in one concurrent fan-out, bounded by
+        ``_SEARCH_CONCURRENCY``; found tracks are then added with a single
+        bulk API call per target service.
+        """
+        sp_unmatched, ym_unmatched = await asyncio.gather(
+            self._db.list_unmatched("spotify"),
+            self._db.list_unmatched("yandex"),
+        )
+        sp_pending = [um for um in sp_unmatched if um.attempts < _MAX_UNMATCHED_ATTEMPTS]
+        ym_pending = [um for um in ym_unmatched if um.attempts < _MAX_UNMATCHED_ATTEMPTS]
+
+        semaphore = asyncio.Semaphore(_SEARCH_CONCURRENCY)
+
+        async def _search(client, target, um):
+            async with semaphore:
+                return await self._search(client, target, um.artist, um.title)
+
+        results = await asyncio.gather(
+            *(_search(ym, "yandex", um) for um in sp_pending),
+            *(_search(sp, "spotify", um) for um in ym_pending),
+            return_exceptions=True,
+        )
+
+        for source_service, target_col_id, add_fn, pending, service_results in [
+            ("spotify", ym_col_id, ym.like_tracks, sp_pending, results[: len(sp_pending)]),
+            ("yandex", sp_col_id, sp.save_tracks, ym_pending, results[len(sp_pending) :]),
         ]:
-            unmatched_list = await self._db.list_unmatched(source_service)
-            for um in unmatched_list:
-                if um.attempts >= _MAX_UNMATCHED_ATTEMPTS:
-                    continue
+            resolved = []  # (unmatched, mapping, found remote_id)
+            # Local-only bookkeeping (one write per track): a single commit
+            async with self._db.transaction():
+                for um, found in zip(pending, service_results, strict=True):
+                    try:
+                        if isinstance(found, Exception):
+                            raise found
+                        if found and self._is_good_match(um.artist, um.title, found.artist, found.title):
+                            id_kw = (
+                                {"yandex_id": found.remote_id}
+                                if source_service == "spotify"
+                                else {"spotify_id": found.remote_id}
+                            )
+                            mapping = await self._db.upsert_track_mapping(
+                                artist=um.artist,
+                                title=um.title,
+                                **{f"{source_service}_id": um.source_id},
+                                **id_kw,
+                            )
+                            resolved.append((um, mapping, found.remote_id))
+                        else:
+                            # Bump attempt counter
+                            await self._db.add_unmatched(
+                                source_service=source_service,
+                                source_id=um.source_id,
+                                artist=um.artist,
+                                title=um.title,
+                            )
+                    except Exception as exc:
+                        log.warning("retry_unmatched_error", error=str(exc))
+                        stats.errors += 1
+
+            if not resolved:
+                continue
+
+            try:
+                await add_fn(list(dict.fromkeys(remote_id for _, _, remote_id in resolved)))
+            except Exception as exc:
+                log.warning("retry_unmatched_error", error=str(exc))
+                stats.errors += len(resolved)
+                continue
+
+            # The remote add has happened: commit each track's record at once
+            for um, mapping, _ in resolved:
                 try:
-                    found = await client.search_track(um.artist, um.title)
-                    if found and self._is_good_match(um.artist, um.title, found.artist, found.title):
-                        id_kw = (
-                            {"yandex_id": found.remote_id}
-                            if source_service == "spotify"
-                            else {"spotify_id": found.remote_id}
-                        )
-                        mapping = await self._db.upsert_track_mapping(
-                            artist=um.artist,
-                            title=um.title,
-                            **{f"{source_service}_id": um.source_id},
-                            **id_kw,
-                        )
-                        await add_fn([found.remote_id])
+                    async with self._db.transaction():
                         await self._db.add_track_to_collection(
                             collection_id=target_col_id,
                             track_mapping_id=mapping.id,
                         )
                         await self._db.resolve_unmatched(source_service, um.source_id)
-                        stats.retried_ok += 1
-                    else:
-                        # Bump attempt counter
-                        await self._db.add_unmatched(
-                            source_service=source_service,
-                            source_id=um.source_id,
-                            artist=um.artist,
-                            title=um.title,
-                        )
+                    stats.retried_ok += 1
                 except Exception as exc:
                     log.warning("retry_unmatched_error", error=str(exc))
                     stats.errors += 1
@@ -0,0 +1,102 @@
+"""Shared concurrency limiter for remote API calls.
+
+One :class:`RateLimiter` is shared by every request a client makes, so
+concurrent fan-outs (``asyncio.gather`` over searches) cannot exceed the
+configured number of in-flight calls.  When the server answers with
+``429 Too Many Requests`` the caller invokes :meth:`RateLimiter.backoff`,
+which holds back *all* pending requests to that host until the
+``Retry-After`` delay has elapsed.
+
+Optionally the limiter also paces requests proactively: with
+``max_per_window`` set, no more than that many requests start within any
+rolling ``window`` seconds, so fan-outs stay under the server's budget
+instead of discovering it through 429s.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+from collections import deque
+from collections.abc import AsyncIterator
+
+DEFAULT_CONCURRENCY = 8
+DEFAULT_WINDOW = 30.0
+
+
+class RateLimiter:
+    """Bounds in-flight requests and pauses a host after a rate-limit response."""
+
+    def __init__(
+        self,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        *,
+        max_per_window: int | None = None,
+        window: float = DEFAULT_WINDOW,
+    ) -> None:
+        self._semaphore = asyncio.Semaphore(concurrency)
+        self._gates: dict[str, asyncio.Event] = {}
+        self._backoffs: dict[str, int] = {}
+        self._max_per_window = max_per_window
+        self._window = window
+        # Reserved start times, oldest first; may lie in the future.
+        self._started: deque[float] = deque()
+
+    def _gate(self, host: str) -> asyncio.Event:
+        gate = self._gates.get(host)
+        if gate is None:
+            gate = self._gates[host] = asyncio.Event()
+            gate.set()
+        return gate
+
+    @contextlib.asynccontextmanager
+    async def limit(self, host: str) -> AsyncIterator[None]:
+        """Hold a request slot for *host*, waiting out any active back-off.
+
+        The gate is awaited *before* taking a slot so that a backed-off host
+        never occupies slots other hosts could use, and re-checked after,
+        in case a back-off started while we were queued on the semaphore.
+        Pacing waits happen before that too, so they never hold a slot.
+        """
+        await self._pace()
+        gate = self._gate(host)
+        while True:
+            await gate.wait()
+            await self._semaphore.acquire()
+            if gate.is_set():
+                break
+            self._semaphore.release()
+        try:
+            yield
+        finally:
+            self._semaphore.release()
+
+    async def backoff(self, host: str, delay: float) -> None:
+        """Block new requests to *host* and sleep for *delay* seconds."""
+        gate = self._gate(host)
+        gate.clear()
+        self._backoffs[host] = self._backoffs.get(host, 0) + 1
+        try:
+            await asyncio.sleep(delay)
+        finally:
+            self._backoffs[host] -= 1
+            if not self._backoffs[host]:
+                gate.set()
+
+    async def _pace(self) -> None:
+        """Wait until starting one more request keeps within ``max_per_window``.
+
+        The start time is reserved synchronously, so concurrent callers wait
+        out their own delays in parallel rather than queueing on each other.
+        """
+        if self._max_per_window is None:
+            return
+        now = asyncio.get_running_loop().time()
+        while self._started and now - self._started[0] >= self._window:
+            self._started.popleft()
+        start = now
+        if len(self._started) >= self._max_per_window:
+            start = max(now, self._started[-self._max_per_window] + self._window)
+        self._started.append(start)
+        if start > now:
+            await asyncio.sleep(start - now)
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import asyncio
 import contextlib
-from datetime import UTC, datetime
+from datetime import UTC, datetime, timedelta
 from typing import TYPE_CHECKING
 
 import structlog
@@ -30,7 +30,7 @@ class SyncScheduler:
         self._default_mode = default_mode
         self._paused = False
         self._stop_event = asyncio.Event()
-        self._trigger_event = asyncio.Event()
+        self._wake = asyncio.Event()  # set by trigger_now() and stop()
         self._trigger_mode: SyncMode | None = None
         self._task: asyncio.Task | None = None
         self._last_sync_at: datetime | None = None
@@ -45,6 +45,7 @@ class SyncScheduler:
         if self.is_running:
             return
         self._stop_event.clear()
+        self._wake.clear()  # stop() may have left it set mid-sync
         self._task = asyncio.create_task(self._loop())
         log.info("scheduler_started", interval_minutes=self._interval // 60)
 
@@ -53,7 +54,7 @@ class SyncScheduler:
         if not self.is_running:
             return
         self._stop_event.set()
-        self._trigger_event.set()  # wake up if sleeping
+        self._wake.set()  # wake up if sleeping
         if self._task:
             await self._task
             self._task = None
@@ -62,7 +63,7 @@ class SyncScheduler:
     def trigger_now(self, mode: SyncMode | None = None) -> None:
         """Trigger an immediate sync. Optionally override mode."""
         self._trigger_mode = mode
-        self._trigger_event.set()
+        self._wake.set()
 
     def pause(self) -> None:
         self._paused = True
@@ -91,17 +92,13 @@ class SyncScheduler:
                 self._next_sync_at = datetime.now(UTC).replace(microsecond=0)
             else:
                 # Calculate next sync time
-                from datetime import timedelta
-
                 self._next_sync_at = datetime.now(UTC).replace(microsecond=0) + timedelta(seconds=self._interval)
 
                 # Interruptible sleep
-                self._trigger_event.clear()
                 with contextlib.suppress(TimeoutError):
-                    await asyncio.wait_for(
-                        self._wait_for_trigger_or_stop(),
-                        timeout=self._interval,
-                    )
+                    async with asyncio.timeout(self._interval):
+                        await self._wake.wait()
+                self._wake.clear()
 
             if self._stop_event.is_set():
                 break
@@ -112,26 +109,9 @@ class SyncScheduler:
             # Determine mode
             mode = self._trigger_mode or self._default_mode
             self._trigger_mode = None
-            self._trigger_event.clear()
 
             try:
-                await self._engine.run_sync(mode)
+                await self._engine.run_sync(mode, since=self._last_sync_at)
                 self._last_sync_at = datetime.now(UTC)
             except Exception as exc:
                 log.error("scheduled_sync_failed", error=str(exc))
-
-    async def _wait_for_trigger_or_stop(self) -> None:
-        """Wait until either trigger or stop event is set."""
-        trigger_task = asyncio.create_task(self._trigger_event.wait())
-        stop_task = asyncio.create_task(self._stop_event.wait())
-        try:
-            done, pending = await asyncio.wait(
-                {trigger_task, stop_task},
-                return_when=asyncio.FIRST_COMPLETED,
-            )
-        finally:
-            for t in (trigger_task, stop_task):
-                if not t.done():
-                    t.cancel()
-                    with contextlib.suppress(asyncio.CancelledError):
-                        await t
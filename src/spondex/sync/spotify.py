@@ -4,28 +4,61 @@ Endpoints:
 - GET /me/tracks (listing liked tracks)
 - PUT /me/tracks (save tracks, body: {"ids": [...]})
 - DELETE /me/tracks (remove tracks, body: {"ids": [...]})
-- GET /search (limit max 10)
+- GET /search (only the top hit is requested)
 """
 
 from __future__ import annotations
 
 import asyncio
+import contextlib
+import hashlib
+import json
+import os
+import tempfile
 import time
+from collections import deque
+from dataclasses import dataclass
 from datetime import datetime
+from pathlib import Path
 
 import httpx
 import structlog
 
 from spondex.config import SpotifyConfig
 from spondex.sync.differ import RemoteTrack
+from spondex.sync.ratelimit import RateLimiter
 
 log = structlog.get_logger(__name__)
 
-_API_BASE = "https://api.spotify.com/v1"
+_API_HOST = "api.spotify.com"
+_API_BASE = f"https://{_API_HOST}/v1"
 _TOKEN_URL = "https://accounts.spotify.com/api/token"  # noqa: S105
 _BATCH_SIZE = 50
-_SEARCH_LIMIT = 10
+_PAGE_SIZE = 50
+_PREFETCH_WINDOW = 8
+_SEARCH_LIMIT = 1  # only items[0] is used
 _MAX_RETRIES = 3
+_WRITE_CONCURRENCY = 4
+_TIMEOUT = 30.0
+_POOL_LIMITS = httpx.Limits(max_keepalive_connections=32, max_connections=64)
+
+
+def create_http_client() -> httpx.AsyncClient:
+    """Build a pooled HTTP client meant to be shared across :class:`SpotifyClient` instances."""
+    return httpx.AsyncClient(timeout=_TIMEOUT, limits=_POOL_LIMITS)
+
+
+@dataclass(frozen=True, slots=True)
+class LikedPage:
+    """One parsed ``/me/tracks`` page."""
+
+    tracks: tuple[RemoteTrack, ...]
+    total: int | None
+    has_next: bool
+
+
+# ``/me/tracks`` offset -> (ETag, parsed page); outlives a single client.
+PageCache = dict[int, tuple[str, LikedPage]]
 
 
 class SpotifyAuthError(Exception):
@@ -43,49 +76,128 @@ class SpotifyClient:
         self,
         config: SpotifyConfig,
         *,
+        limiter: RateLimiter | None = None,
+        http: httpx.AsyncClient | None = None,
+        token_cache: Path | None = None,
+        page_cache: PageCache | None = None,
         _transport: httpx.AsyncBaseTransport | None = None,
     ) -> None:
         self._config = config
+        self._limiter = limiter or RateLimiter()
+        self._http = http
+        self._token_cache = token_cache
+        self._page_cache = page_cache
         self._transport = _transport
         self._access_token: str | None = None
         self._token_expires_at: float = 0.0
+        self._token_lock = asyncio.Lock()
         self._client: httpx.AsyncClient | None = None
 
     async def __aenter__(self) -> SpotifyClient:
-        kw: dict = {"timeout": 30.0}
+        self._load_token()
+        if self._http is not None:
+            # Shared pool owned by the caller — kept open on exit.
+            self._client = self._http
+            return self
+        kw: dict = {"timeout": _TIMEOUT}
         if self._transport is not None:
             kw["transport"] = self._transport
         self._client = httpx.AsyncClient(**kw)
         return self
 
     async def __aexit__(self, *exc: object) -> None:
-        if self._client:
+        if self._client and self._client is not self._http:
             await self._client.aclose()
-            self._client = None
+        self._client = None
 
     # -- auth --
 
     async def _ensure_token(self, *, force: bool = False) -> str:
-        if not force and self._access_token and time.time() < self._token_expires_at - 60:
+        stale_token = self._access_token
+        if not force and self._token_valid():
             return self._access_token
 
-        assert self._client is not None  # noqa: S101
-        resp = await self._client.post(
-            _TOKEN_URL,
-            data={
-                "grant_type": "refresh_token",
-                "refresh_token": self._config.refresh_token.get_secret_value(),
-                "client_id": self._config.client_id,
-                "client_secret": self._config.client_secret.get_secret_value(),
-            },
-        )
-        if resp.status_code != 200:
-            raise SpotifyAuthError(f"Token refresh failed: {resp.status_code} {resp.text}")
+        # Concurrent requests share one refresh instead of each posting to /api/token.
+        async with self._token_lock:
+            if self._access_token != stale_token and self._token_valid():
+                return self._access_token
+
+            assert self._client is not None  # noqa: S101
+            resp = await self._client.post(
+                _TOKEN_URL,
+                data={
+                    "grant_type": "refresh_token",
+                    "refresh_token": self._config.refresh_token.get_secret_value(),
+                    "client_id": self._config.client_id,
+                    "client_secret": self._config.client_secret.get_secret_value(),
+                },
+            )
+            if resp.status_code != 200:
+                raise SpotifyAuthError(f"Token refresh failed: {resp.status_code} {resp.text}")
 
-        data = resp.json()
-        self._access_token = data["access_token"]
-        self._token_expires_at = time.time() + data.get("expires_in", 3600)
-        return self._access_token
+            data = resp.json()
+            self._access_token = data["access_token"]
+            self._token_expires_at = time.time() + data.get("expires_in", 3600)
+            self._save_token()
+            return self._access_token
+
+    def _token_valid(self) -> bool:
+        return self._access_token is not None and time.time() < self._token_expires_at - 60
+
+    def _read_token_cache(self) -> dict:
+        assert self._token_cache is not None  # noqa: S101
+        try:
+            data = json.loads(self._token_cache.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        return data if isinstance(data, dict) else {}
+
+    def _refresh_fingerprint(self) -> str:
+        """Identify the account behind the refresh token without storing it."""
+        return hashlib.sha256(self._config.refresh_token.get_secret_value().encode()).hexdigest()[:16]
+
+    def _load_token(self) -> None:
+        """Restore a cached access token for this ``client_id``, if still valid.
+
+        Entries minted from a different refresh token (another account) are
+        ignored.
+        """
+        if self._token_cache is None or self._token_valid():
+            return
+        entry = self._read_token_cache().get(self._config.client_id)
+        if not isinstance(entry, dict) or entry.get("refresh_fingerprint") != self._refresh_fingerprint():
+            return
+        try:
+            token, expires_at = str(entry["access_token"]), float(entry["expires_at"])
+        except (KeyError, TypeError, ValueError):
+            return
+        if time.time() < expires_at - 60:
+            self._access_token, self._token_expires_at = token, expires_at
+
+    def _save_token(self) -> None:
+        """Persist the access token atomically with owner-only permissions."""
+        if self._token_cache is None:
+            return
+        data = self._read_token_cache()
+        data[self._config.client_id] = {
+            "access_token": self._access_token,
+            "expires_at": self._token_expires_at,
+            "refresh_fingerprint": self._refresh_fingerprint(),
+        }
+        path = self._token_cache
+        try:
+            path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump(data, f)
+                os.replace(tmp, path)
+            except BaseException:
+                with contextlib.suppress(OSError):
+                    os.unlink(tmp)
+                raise
+        except OSError as exc:
+            log.warning("spotify_token_cache_write_failed", path=str(path), error=str(exc))
 
     # -- request helper --
 
@@ -96,21 +208,23 @@ class SpotifyClient:
         *,
         json: dict | list | None = None,
         params: dict | None = None,
+        headers: dict[str, str] | None = None,
     ) -> httpx.Response:
         assert self._client is not None  # noqa: S101
 
         for attempt in range(_MAX_RETRIES):
             token = await self._ensure_token()
-            headers = {"Authorization": f"Bearer {token}"}
+            req_headers = {"Authorization": f"Bearer {token}", **(headers or {})}
 
             try:
-                resp = await self._client.request(
-                    method,
-                    url,
-                    headers=headers,
-                    json=json,
-                    params=params,
-                )
+                async with self._limiter.limit(_API_HOST):
+                    resp = await self._client.request(
+                        method,
+                        url,
+                        headers=req_headers,
+                        json=json,
+                        params=params,
+                    )
             except httpx.TransportError as exc:
                 if attempt >= _MAX_RETRIES - 1:
                     raise SpotifyAPIError(f"Network error after {_MAX_RETRIES} retries: {exc}") from exc
@@ -143,7 +257,7 @@ class SpotifyClient:
                     retry_after=retry_after,
                     attempt=attempt,
                 )
-                await asyncio.sleep(retry_after)
+                await self._limiter.backoff(_API_HOST, retry_after)
                 continue
 
             if resp.status_code >= 400:
@@ -166,68 +280,145 @@ class SpotifyClient:
             since: If provided (incremental mode), stop paginating when
                    ``added_at < since``.  Spotify returns newest first.
 
+        Without *since*, the first page's ``total`` is used to request all
+        remaining pages concurrently (bounded by the client's rate limiter).
+
         Returns:
             List of :class:`RemoteTrack` with ``service="spotify"``.
         """
+        if since is not None:
+            return await self._get_liked_tracks_since(since)
+
+        first = await self._get_liked_page(0)
+        pages = [first]
+        # Stride by what the server actually returned, in case it caps ``limit``.
+        step = len(first.tracks) or _PAGE_SIZE
+        if first.has_next:
+            offsets = range(step, first.total or 0, step)
+            # Let every page settle before raising, so no request outlives the client.
+            rest = await asyncio.gather(*(self._get_liked_page(offset) for offset in offsets), return_exceptions=True)
+            for page in rest:
+                if isinstance(page, BaseException):
+                    raise page
+            pages.extend(rest)
+
+        return [track for page in pages for track in page.tracks]
+
+    async def _get_liked_tracks_since(self, since: datetime) -> list[RemoteTrack]:
+        """Page through liked tracks in order until ``added_at < since``.
+
+        Most incremental runs stop on the first page, so only that page is
+        requested up front.  Each page that doesn't reach *since* doubles the
+        number of pages prefetched (up to ``_PREFETCH_WINDOW``), overlapping
+        IO with parsing on long walks; pages are still consumed in order.
+        """
         tracks: list[RemoteTrack] = []
-        offset = 0
-
-        while True:
-            resp = await self._request(
-                "GET",
-                f"{_API_BASE}/me/tracks",
-                params={"limit": 50, "offset": offset},
-            )
-            data = resp.json()
-
-            page_items = data.get("items", [])
-            if not page_items:
-                break
-
-            stop_paging = False
-            for item in page_items:
-                track = item["track"]
-                added_at_str = item.get("added_at")
-
-                # Incremental: check timestamp
-                if since and added_at_str:
-                    added_dt = datetime.fromisoformat(added_at_str.replace("Z", "+00:00"))
-                    if added_dt < since:
+        pending: deque[asyncio.Future[LikedPage]] = deque([asyncio.ensure_future(self._get_liked_page(0))])
+        step: int | None = None
+        next_offset = 0
+        window = 1
+
+        try:
+            while pending:
+                page = await pending.popleft()
+                if not page.tracks:
+                    break
+
+                stop_paging = False
+                for track in page.tracks:
+                    if track.added_at and datetime.fromisoformat(track.added_at) < since:
                         stop_paging = True
                         break
+                    tracks.append(track)
+
+                if stop_paging or not page.has_next:
+                    break
+
+                if step is None:
+                    # Stride by what the server returned, as in the full listing.
+                    step = next_offset = len(page.tracks)
+                total = page.total
+                window = min(window * 2, _PREFETCH_WINDOW)
+                while len(pending) < window and (total is None or next_offset < total):
+                    pending.append(asyncio.ensure_future(self._get_liked_page(next_offset)))
+                    next_offset += step
+        finally:
+            for fut in pending:
+                fut.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
 
-                artists = track.get("artists", [])
-                artist_name = artists[0]["name"] if artists else "Unknown"
-
-                tracks.append(
-                    RemoteTrack(
-                        service="spotify",
-                        remote_id=track["id"],
-                        artist=artist_name,
-                        title=track["name"],
-                        added_at=added_at_str,
-                        duration_ms=track.get("duration_ms"),
-                    )
-                )
+        return tracks
 
-            if stop_paging or data.get("next") is None:
-                break
+    async def _get_liked_page(self, offset: int) -> LikedPage:
+        """Fetch one ``/me/tracks`` page, revalidating a cached copy by ETag.
 
-            offset += 50
+        Only the parsed tracks are cached, and offsets past the latest
+        ``total`` are evicted so a shrinking library doesn't leave stale pages.
+        """
+        cached = self._page_cache.get(offset) if self._page_cache is not None else None
+        resp = await self._request(
+            "GET",
+            f"{_API_BASE}/me/tracks",
+            params={"limit": _PAGE_SIZE, "offset": offset},
+            headers={"If-None-Match": cached[0]} if cached else None,
+        )
+        if resp.status_code == 304 and cached:
+            return cached[1]
 
-        return tracks
+        data = resp.json()
+        page = LikedPage(
+            tracks=tuple(self._track_from_item(item) for item in data.get("items", [])),
+            total=data.get("total"),
+            has_next=data.get("next") is not None,
+        )
+        if self._page_cache is not None:
+            etag = resp.headers.get("ETag")
+            if etag:
+                self._page_cache[offset] = (etag, page)
+            if page.total is not None:
+                for stale in [o for o in self._page_cache if o >= page.total]:
+                    del self._page_cache[stale]
+        return page
+
+    @staticmethod
+    def _track_from_item(item: dict) -> RemoteTrack:
+        """Build a :class:`RemoteTrack` from a ``/me/tracks`` page item."""
+        track = item["track"]
+        artists = track.get("artists", [])
+        artist_name = artists[0]["name"] if artists else "Unknown"
+        return RemoteTrack(
+            service="spotify",
+            remote_id=track["id"],
+            artist=artist_name,
+            title=track["name"],
+            added_at=item.get("added_at"),
+            duration_ms=track.get("duration_ms"),
+        )
 
     async def save_tracks(self, track_ids: list[str]) -> None:
         """Save tracks to the user's library in batches of 50."""
-        for i in range(0, len(track_ids), _BATCH_SIZE):
-            batch = track_ids[i : i + _BATCH_SIZE]
-            await self._request("PUT", f"{_API_BASE}/me/tracks", json={"ids": batch})
+        await self._write_batches("PUT", track_ids)
 
     async def remove_tracks(self, track_ids: list[str]) -> None:
         """Remove tracks from the user's library in batches of 50."""
-        for i in range(0, len(track_ids), _BATCH_SIZE):
-            batch = track_ids[i : i + _BATCH_SIZE]
-            await self._request("DELETE", f"{_API_BASE}/me/tracks", json={"ids": batch})
+        await self._write_batches("DELETE", track_ids)
+
+    async def _write_batches(self, method: str, track_ids: list[str]) -> None:
+        """Send ``/me/tracks`` writes concurrently, at most ``_WRITE_CONCURRENCY`` at a time."""
+        sem = asyncio.Semaphore(_WRITE_CONCURRENCY)
+
+        async def _send(batch: list[str]) -> None:
+            async with sem:
+                await self._request(method, f"{_API_BASE}/me/tracks", json={"ids": batch})
+
+        results = await asyncio.gather(
+            *(_send(track_ids[i : i + _BATCH_SIZE]) for i in range(0, len(track_ids), _BATCH_SIZE)),
+            return_exceptions=True,
+        )
+        # Raise only once every batch has settled, so none outlives the client.
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
 
     async def search_track(self, artist: str, title: str) -> RemoteTrack | None:
         """Search for a track on Spotify by artist and title.
@@ -7,16 +7,22 @@ asyncio.to_thread() to avoid blocking the event loop.
 from __future__ import annotations
 
 import asyncio
+from collections.abc import Callable
 from datetime import datetime
+from typing import Any
 
 import structlog
 
 from spondex.config import YandexConfig
 from spondex.sync.differ import RemoteTrack
+from spondex.sync.ratelimit import RateLimiter
 
 log = structlog.get_logger(__name__)
 
+_API_HOST = "api.music.yandex.net"
 _BATCH_SIZE = 100
+_MAX_RETRIES = 3
+_AUTH_HINT = "Your token may be invalid — run: spondex config set yandex.token <new_token>"
 
 
 class YandexAuthError(Exception):
@@ -30,23 +36,61 @@ class YandexAPIError(Exception):
 class YandexClient:
     """Async wrapper around the synchronous yandex-music library."""
 
-    def __init__(self, config: YandexConfig) -> None:
+    def __init__(
+        self,
+        config: YandexConfig,
+        *,
+        limiter: RateLimiter | None = None,
+        account_uid: int | None = None,
+    ) -> None:
         self._config = config
+        self._limiter = limiter or RateLimiter()
+        self._account_uid = account_uid
         self._client = None  # yandex_music.Client, set in __aenter__
 
+    @property
+    def account_uid(self) -> int | None:
+        """Account uid resolved by ``init()``; pass it back in to skip that request."""
+        return self._account_uid
+
+    async def _call(self, func: Callable[..., Any], *args: Any) -> Any:
+        """Run a blocking yandex-music call in a thread under the shared limiter.
+
+        yandex-music surfaces HTTP 429 as a ``NetworkError`` without the
+        ``Retry-After`` value, so rate-limited calls back off exponentially.
+        """
+        from yandex_music.exceptions import NetworkError, UnauthorizedError
+
+        for attempt in range(_MAX_RETRIES):
+            try:
+                async with self._limiter.limit(_API_HOST):
+                    return await asyncio.to_thread(func, *args)
+            except UnauthorizedError as exc:
+                # Only reachable when __aenter__ skipped init() for a known uid
+                raise YandexAuthError(f"Yandex Music auth failed: {exc}. {_AUTH_HINT}") from exc
+            except NetworkError as exc:
+                if "(429)" not in str(exc) or attempt >= _MAX_RETRIES - 1:
+                    raise
+                wait = 2**attempt
+                log.warning("yandex_rate_limited", retry_in=wait, attempt=attempt)
+                await self._limiter.backoff(_API_HOST, wait)
+        raise YandexAPIError(f"Max retries ({_MAX_RETRIES}) exceeded")
+
     async def __aenter__(self) -> YandexClient:
         from yandex_music import Client
 
         token = self._config.token.get_secret_value()
         try:
             client = await asyncio.to_thread(Client, token)
-            self._client = await asyncio.to_thread(client.init)
+            if self._account_uid is not None:
+                # Likes endpoints only need the uid; skip the account_status round-trip
+                client.account_uid = self._account_uid
+                self._client = client
+            else:
+                self._client = await asyncio.to_thread(client.init)
+                self._account_uid = self._client.account_uid
         except Exception as exc:
-            raise YandexAuthError(
-                f"Yandex Music auth failed: {exc}. "
-                "Your token may be invalid — run: "
-                "spondex config set yandex.token <new_token>"
-            ) from exc
+            raise YandexAuthError(f"Yandex Music auth failed: {exc}. {_AUTH_HINT}") from exc
         return self
 
     async def __aexit__(self, *exc: object) -> None:
@@ -57,7 +101,7 @@ class YandexClient:
         assert self._client is not None
 
         # Step 1: Get all liked track short infos
-        likes = await asyncio.to_thread(self._client.users_likes_tracks)
+        likes = await self._call(self._client.users_likes_tracks)
 
         if not likes:
             return []
@@ -83,7 +127,7 @@ class YandexClient:
             # Incremental filter
             if since and ts_str:
                 try:
-                    ts_dt = datetime.fromisoformat(ts_str.replace("Z", "+00:00"))
+                    ts_dt = datetime.fromisoformat(ts_str)
                     if ts_dt < since:
                         continue
                 except (ValueError, AttributeError):
@@ -95,13 +139,17 @@ class YandexClient:
         if not track_ids:
             return []
 
-        # Step 2: Batch fetch full track objects
-        all_tracks = []
-        for i in range(0, len(track_ids), _BATCH_SIZE):
-            batch = track_ids[i : i + _BATCH_SIZE]
-            full_tracks = await asyncio.to_thread(self._client.tracks, batch)
-            if full_tracks:
-                all_tracks.extend(full_tracks)
+        # Step 2: Batch fetch full track objects, concurrently (bounded by the limiter)
+        batches = [track_ids[i : i + _BATCH_SIZE] for i in range(0, len(track_ids), _BATCH_SIZE)]
+        results = await asyncio.gather(
+            *(self._call(self._client.tracks, batch) for batch in batches),
+            return_exceptions=True,
+        )
+        # Raise only once every batch has settled, so none outlives the client.
+        for full_tracks in results:
+            if isinstance(full_tracks, BaseException):
+                raise full_tracks
+        all_tracks = [ft for full_tracks in results if full_tracks for ft in full_tracks]
 
         # Step 3: Build RemoteTrack list
         result: list[RemoteTrack] = []
@@ -130,20 +178,20 @@ class YandexClient:
         """Add tracks to liked."""
         assert self._client is not None
         if track_ids:
-            await asyncio.to_thread(self._client.users_likes_tracks_add, track_ids)
+            await self._call(self._client.users_likes_tracks_add, track_ids)
 
     async def unlike_tracks(self, track_ids: list[str]) -> None:
         """Remove tracks from liked."""
         assert self._client is not None
         if track_ids:
-            await asyncio.to_thread(self._client.users_likes_tracks_remove, track_ids)
+            await self._call(self._client.users_likes_tracks_remove, track_ids)
 
     async def search_track(self, artist: str, title: str) -> RemoteTrack | None:
         """Search for a track on Yandex Music."""
         assert self._client is not None
 
         query = f"{artist} {title}"
-        result = await asyncio.to_thread(self._client.search, query)
+        result = await self._call(self._client.search, query)
 
         if result and result.best and result.best.type == "track":
             track = result.best.result
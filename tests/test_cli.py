@@ -56,9 +56,6 @@ def test_status_daemon_not_running(cli_base_dir: Path):
 
 
 def test_stop_daemon_not_running(cli_base_dir: Path):
-    with patch("spondex.cli.Daemon" if False else "spondex.daemon.Daemon") as _:
-        pass
-
     with patch("spondex.daemon.Daemon.is_running", return_value=False):
         result = runner.invoke(app, ["stop"])
 
@@ -5,6 +5,7 @@ from __future__ import annotations
 import os
 import stat
 import tomllib
+import warnings
 from pathlib import Path
 
 import pytest
@@ -18,6 +19,7 @@ from spondex.config import (
     YandexConfig,
     _dump_toml,
     _format_toml_value,
+    check_config_permissions,
     config_exists,
     ensure_dirs,
     load_config,
@@ -39,6 +41,7 @@ def test_sync_config_defaults():
     cfg = SyncConfig()
     assert cfg.interval_minutes == 30
     assert cfg.mode == "incremental"
+    assert cfg.spotify_requests_per_window == 0
 
 
 def test_app_config_defaults():
@@ -79,24 +82,16 @@ def test_log_dir(base_dir: Path):
 # ---------------------------------------------------------------------------
 
 
-def test_ensure_dirs_creates_directories(base_dir: Path, tmp_path: Path):
+def test_ensure_dirs_creates_directories(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
     # Point to a fresh subdirectory that does NOT exist yet so we can verify
     # ensure_dirs creates it from scratch.
     fresh = tmp_path / "fresh_base"
-    # Overwrite the monkeypatch that base_dir already set, pointing to the
-    # new location.  We import the module so we can patch the function object
-    # in-place for the remainder of this test.
-    import spondex.config as config_mod
+    monkeypatch.setattr("spondex.config.get_base_dir", lambda: fresh)
 
-    original = config_mod.get_base_dir
-    config_mod.get_base_dir = lambda: fresh
-    try:
-        assert not fresh.exists()
-        ensure_dirs()
-        assert fresh.is_dir()
-        assert (fresh / "logs").is_dir()
-    finally:
-        config_mod.get_base_dir = original
+    assert not fresh.exists()
+    ensure_dirs()
+    assert fresh.is_dir()
+    assert (fresh / "logs").is_dir()
 
 
 # ---------------------------------------------------------------------------
@@ -370,8 +365,6 @@ def test_is_yandex_configured_true_when_set():
 
 def test_check_config_permissions_ok(base_dir: Path):
     """check_config_permissions returns None for 600 permissions."""
-    from spondex.config import check_config_permissions
-
     save_config(AppConfig())
     config_path = base_dir / "config.toml"
     os.chmod(config_path, 0o600)
@@ -381,8 +374,6 @@ def test_check_config_permissions_ok(base_dir: Path):
 
 def test_check_config_permissions_warns_group_readable(base_dir: Path):
     """check_config_permissions warns when group can read."""
-    from spondex.config import check_config_permissions
-
     save_config(AppConfig())
     config_path = base_dir / "config.toml"
     os.chmod(config_path, 0o644)
@@ -394,15 +385,21 @@ def test_check_config_permissions_warns_group_readable(base_dir: Path):
 
 def test_check_config_permissions_no_file(base_dir: Path):
     """check_config_permissions returns None when no config file."""
-    from spondex.config import check_config_permissions
-
     assert check_config_permissions() is None
 
 
+def test_check_config_permissions_uses_given_stat(base_dir: Path):
+    """check_config_permissions judges the stat result it is handed."""
+    save_config(AppConfig())
+    config_path = base_dir / "config.toml"
+    st = os.stat(config_path)
+    os.chmod(config_path, 0o644)
+
+    assert check_config_permissions(st) is None
+
+
 def test_load_config_warns_on_bad_permissions(base_dir: Path):
     """load_config emits a warning for overly permissive config."""
-    import warnings
-
     save_config(AppConfig())
     config_path = base_dir / "config.toml"
     os.chmod(config_path, 0o644)
@@ -92,9 +92,10 @@ async def test_status_with_data(_make_dashboard_client, dashboard_db: Database)
 
 @pytest.mark.asyncio
 async def test_history_pagination(_make_dashboard_client, dashboard_db: Database) -> None:
-    for _i in range(5):
-        run = await dashboard_db.start_sync_run(direction="bidirectional", mode="full")
-        await dashboard_db.finish_sync_run(run.id, status="completed")
+    async with dashboard_db.transaction():
+        for _i in range(5):
+            run = await dashboard_db.start_sync_run(direction="bidirectional", mode="full")
+            await dashboard_db.finish_sync_run(run.id, status="completed")
 
     client, _state, _db = _make_dashboard_client()
 
@@ -119,9 +120,10 @@ async def test_history_pagination(_make_dashboard_client, dashboard_db: Database
 
 @pytest.mark.asyncio
 async def test_tracks_search_pagination(_make_dashboard_client, dashboard_db: Database) -> None:
-    await dashboard_db.upsert_track_mapping(artist="Queen", title="Bohemian Rhapsody", spotify_id="sp1")
-    await dashboard_db.upsert_track_mapping(artist="Queen", title="We Will Rock You", spotify_id="sp2")
-    await dashboard_db.upsert_track_mapping(artist="Beatles", title="Yesterday", spotify_id="sp3")
+    async with dashboard_db.transaction():
+        await dashboard_db.upsert_track_mapping(artist="Queen", title="Bohemian Rhapsody", spotify_id="sp1")
+        await dashboard_db.upsert_track_mapping(artist="Queen", title="We Will Rock You", spotify_id="sp2")
+        await dashboard_db.upsert_track_mapping(artist="Beatles", title="Yesterday", spotify_id="sp3")
 
     client, _state, _db = _make_dashboard_client()
 
@@ -234,9 +236,10 @@ def test_pause_no_scheduler(_make_dashboard_client) -> None:
 
 @pytest.mark.asyncio
 async def test_collections(_make_dashboard_client, dashboard_db: Database) -> None:
-    col = await dashboard_db.create_collection(service="spotify", collection_type="liked", title="Liked Songs")
-    mapping = await dashboard_db.upsert_track_mapping(artist="Test", title="Song", spotify_id="sp1")
-    await dashboard_db.add_track_to_collection(collection_id=col.id, track_mapping_id=mapping.id)
+    async with dashboard_db.transaction():
+        col = await dashboard_db.create_collection(service="spotify", collection_type="liked", title="Liked Songs")
+        mapping = await dashboard_db.upsert_track_mapping(artist="Test", title="Song", spotify_id="sp1")
+        await dashboard_db.add_track_to_collection(collection_id=col.id, track_mapping_id=mapping.id)
 
     client, _state, _db = _make_dashboard_client()
     resp = client.get("/api/collections")
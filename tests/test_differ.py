@@ -51,6 +51,11 @@ def test_normalize_complex():
     assert normalize("Lose Yourself (feat. Eminem) [Remix]") == "lose yourself"
 
 
+def test_normalize_fullwidth_compatibility():
+    # Non-ASCII input still goes through NFKD
+    assert normalize("\uff33\uff4f\uff4e\uff47") == "song"
+
+
 # -- make_match_key tests --
 
 
@@ -129,3 +134,8 @@ def test_cross_match_one_empty():
     assert len(matches) == 0
     assert len(unmatched_sp) == 1
     assert unmatched_ym == []
+
+
+def test_remote_track_coerces_remote_id_to_str():
+    track = RemoteTrack(service="yandex", remote_id=12345, artist="A", title="B")
+    assert track.remote_id == "12345"
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import asyncio
+from datetime import UTC, datetime
 
 import pytest
 import pytest_asyncio
@@ -185,6 +186,73 @@ async def test_propagate_additions_both_directions(db):
     assert sp.saved_ids == ["sp_found"]
 
 
+@pytest.mark.asyncio
+async def test_propagate_search_error_counted(db):
+    """A failing search counts as an error and writes nothing for the target side."""
+
+    class FailingSearchClient(MockClient):
+        async def search_track(self, artist, title):
+            raise RuntimeError("search down")
+
+    sp = MockClient(liked_tracks=[_sp_track("sp1", "Art", "Song")])
+    ym = FailingSearchClient(liked_tracks=[])
+
+    engine = SyncEngine(
+        _make_config(),
+        db,
+        sp_factory=_mock_factory(sp),
+        ym_factory=_mock_factory(ym),
+    )
+    stats = await engine.run_sync()
+
+    assert stats.errors == 1
+    assert stats.unmatched == 0
+    assert ym.liked_ids == []
+
+    sp_col = await db.find_collection(service="spotify", collection_type="liked")
+    ym_col = await db.find_collection(service="yandex", collection_type="liked")
+    mapping = await db.find_track_mapping(spotify_id="sp1")
+    assert mapping.yandex_id is None
+    assert [ct.track_mapping_id for ct in await db.list_collection_tracks(sp_col.id)] == [mapping.id]
+    assert await db.list_collection_tracks(ym_col.id) == []
+    assert await db.list_unmatched() == []
+
+
+@pytest.mark.asyncio
+async def test_identical_searches_share_one_request_per_run(db):
+    """Equal queries (up to case/Unicode form) hit the API once within a sync run."""
+
+    class CountingSearchClient(MockClient):
+        search_calls = 0
+
+        async def search_track(self, artist, title):
+            self.search_calls += 1
+            return None
+
+    sp = MockClient(
+        liked_tracks=[
+            _sp_track("sp1", "Art", "Song"),
+            _sp_track("sp2", "ART", "song "),
+        ]
+    )
+    ym = CountingSearchClient(liked_tracks=[])
+
+    engine = SyncEngine(
+        _make_config(),
+        db,
+        sp_factory=_mock_factory(sp),
+        ym_factory=_mock_factory(ym),
+    )
+    stats = await engine.run_sync()
+
+    # Propagation and the retry pass in the same full sync reuse the first result
+    assert ym.search_calls == 1
+    assert stats.unmatched == 2
+
+    await engine.run_sync(mode="full")
+    assert ym.search_calls == 2
+
+
 @pytest.mark.asyncio
 async def test_full_sync_removals(db):
     """Full sync should propagate deletions when enabled."""
@@ -200,12 +268,13 @@ async def test_full_sync_removals(db):
     )
 
     # First: seed DB with a track on both sides
-    mapping = await db.upsert_track_mapping(artist="Art", title="Song", spotify_id="sp1", yandex_id="ym1")
-    sp_col = await db.create_collection(service="spotify", collection_type="liked", title="Liked Songs")
-    ym_col = await db.create_collection(service="yandex", collection_type="liked", title="Liked Songs")
-    await db.pair_collections(sp_col.id, ym_col.id)
-    await db.add_track_to_collection(collection_id=sp_col.id, track_mapping_id=mapping.id)
-    await db.add_track_to_collection(collection_id=ym_col.id, track_mapping_id=mapping.id)
+    async with db.transaction():
+        mapping = await db.upsert_track_mapping(artist="Art", title="Song", spotify_id="sp1", yandex_id="ym1")
+        sp_col = await db.create_collection(service="spotify", collection_type="liked", title="Liked Songs")
+        ym_col = await db.create_collection(service="yandex", collection_type="liked", title="Liked Songs")
+        await db.pair_collections(sp_col.id, ym_col.id)
+        await db.add_track_to_collection(collection_id=sp_col.id, track_mapping_id=mapping.id)
+        await db.add_track_to_collection(collection_id=ym_col.id, track_mapping_id=mapping.id)
 
     stats = await engine.run_sync(mode="full")
 
@@ -232,11 +301,12 @@ async def test_incremental_no_removals(db):
     await db.finish_sync_run(run.id, status="completed")
 
     # Seed a mapping that would be "removed"
-    mapping = await db.upsert_track_mapping(artist="Art", title="Song", spotify_id="sp1", yandex_id="ym1")
-    sp_col = await db.create_collection(service="spotify", collection_type="liked", title="Liked Songs")
-    ym_col = await db.create_collection(service="yandex", collection_type="liked", title="Liked Songs")
-    await db.pair_collections(sp_col.id, ym_col.id)
-    await db.add_track_to_collection(collection_id=sp_col.id, track_mapping_id=mapping.id)
+    async with db.transaction():
+        mapping = await db.upsert_track_mapping(artist="Art", title="Song", spotify_id="sp1", yandex_id="ym1")
+        sp_col = await db.create_collection(service="spotify", collection_type="liked", title="Liked Songs")
+        ym_col = await db.create_collection(service="yandex", collection_type="liked", title="Liked Songs")
+        await db.pair_collections(sp_col.id, ym_col.id)
+        await db.add_track_to_collection(collection_id=sp_col.id, track_mapping_id=mapping.id)
 
     stats = await engine.run_sync()  # should be incremental
 
@@ -266,6 +336,45 @@ async def test_sync_error_state(db):
     assert engine.state == SyncState.ERROR
 
 
+@pytest.mark.asyncio
+async def test_failed_sync_keeps_completed_writes(db, monkeypatch):
+    """A late failure must not roll back the record of remote writes already made."""
+    sp = MockClient(
+        liked_tracks=[
+            _sp_track("sp1", "Art", "Song"),
+            _sp_track("sp2", "Other", "Tune"),
+        ]
+    )
+    ym = MockClient(
+        liked_tracks=[_ym_track("ym1", "Art", "Song")],
+        search_results={"Other Tune": _ym_track("ym2", "Other", "Tune")},
+    )
+
+    engine = SyncEngine(
+        _make_config(),
+        db,
+        sp_factory=_mock_factory(sp),
+        ym_factory=_mock_factory(ym),
+    )
+
+    async def failing_retry(*args):
+        raise RuntimeError("late failure")
+
+    monkeypatch.setattr(engine, "_retry_unmatched", failing_retry)
+
+    with pytest.raises(RuntimeError, match="late failure"):
+        await engine.run_sync(mode="full")
+
+    # sp2 was liked on Yandex before the failure; its mapping must survive
+    assert ym.liked_ids == ["ym2"]
+    propagated = await db.find_track_mapping(spotify_id="sp2")
+    assert propagated is not None
+    assert propagated.yandex_id == "ym2"
+    assert await db.find_track_mapping(spotify_id="sp1") is not None
+    runs = await db.list_sync_runs()
+    assert runs[0].status == "failed"
+
+
 @pytest.mark.asyncio
 async def test_concurrent_sync_blocked(db):
     """Concurrent sync attempts should raise."""
@@ -323,6 +432,131 @@ async def test_retry_unmatched(db):
     assert len(remaining) == 0
 
 
+@pytest.mark.asyncio
+async def test_retry_unmatched_bulk_add(db):
+    """Found retries should be added with one bulk call; misses bump attempts."""
+    await db.add_unmatched(source_service="yandex", source_id="ym1", artist="Art", title="One")
+    await db.add_unmatched(source_service="yandex", source_id="ym2", artist="Art", title="Two")
+    await db.add_unmatched(source_service="yandex", source_id="ym3", artist="Art", title="Missing")
+
+    class CountingClient(MockClient):
+        save_calls = 0
+
+        async def save_tracks(self, ids):
+            self.save_calls += 1
+            await super().save_tracks(ids)
+
+    sp = CountingClient(
+        liked_tracks=[],
+        search_results={
+            "Art One": _sp_track("sp_one", "Art", "One"),
+            "Art Two": _sp_track("sp_two", "Art", "Two"),
+        },
+    )
+    ym = MockClient(liked_tracks=[])
+
+    engine = SyncEngine(
+        _make_config(),
+        db,
+        sp_factory=_mock_factory(sp),
+        ym_factory=_mock_factory(ym),
+    )
+    stats = await engine.run_sync(mode="full")
+
+    assert stats.retried_ok == 2
+    assert sp.save_calls == 1
+    assert sp.saved_ids == ["sp_one", "sp_two"]
+
+    remaining = await db.list_unmatched("yandex")
+    assert [(um.source_id, um.attempts) for um in remaining] == [("ym3", 2)]
+
+
+@pytest.mark.asyncio
+async def test_retry_unmatched_fan_out_is_bounded(db):
+    """Retry searches for both services share one bounded concurrent fan-out."""
+    for i in range(12):
+        await db.add_unmatched(source_service="spotify", source_id=f"sp{i}", artist="Art", title=f"S{i}")
+        await db.add_unmatched(source_service="yandex", source_id=f"ym{i}", artist="Art", title=f"Y{i}")
+
+    active = 0
+    peak = 0
+
+    class TrackingClient(MockClient):
+        async def search_track(self, artist, title):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0)
+            active -= 1
+            return None
+
+    engine = SyncEngine(
+        _make_config(),
+        db,
+        sp_factory=_mock_factory(TrackingClient()),
+        ym_factory=_mock_factory(TrackingClient()),
+    )
+    await engine.run_sync(mode="full")
+
+    assert 1 < peak <= 8
+
+
+@pytest.mark.asyncio
+async def test_since_override_skips_last_sync_lookup(db, monkeypatch):
+    """A caller-supplied ``since`` should skip the last-successful-sync query."""
+    run = await db.start_sync_run(direction="bidirectional", mode="full")
+    await db.finish_sync_run(run.id, status="completed")
+
+    lookups = 0
+    original = db.get_last_successful_sync
+
+    async def counting_lookup():
+        nonlocal lookups
+        lookups += 1
+        return await original()
+
+    monkeypatch.setattr(db, "get_last_successful_sync", counting_lookup)
+
+    engine = SyncEngine(
+        _make_config(),
+        db,
+        sp_factory=_mock_factory(MockClient()),
+        ym_factory=_mock_factory(MockClient()),
+    )
+    await engine.run_sync("incremental", since=datetime(2026, 1, 1, tzinfo=UTC))
+    await engine.run_sync("full")
+
+    assert lookups == 0
+    runs = await db.list_sync_runs()
+    assert [r.mode for r in runs[:2]] == ["full", "incremental"]
+
+
+@pytest.mark.asyncio
+async def test_first_run_without_since_queries_db(db, monkeypatch):
+    """Without ``since`` the engine still looks up the last run (and forces full)."""
+    lookups = 0
+    original = db.get_last_successful_sync
+
+    async def counting_lookup():
+        nonlocal lookups
+        lookups += 1
+        return await original()
+
+    monkeypatch.setattr(db, "get_last_successful_sync", counting_lookup)
+
+    engine = SyncEngine(
+        _make_config(mode="incremental"),
+        db,
+        sp_factory=_mock_factory(MockClient()),
+        ym_factory=_mock_factory(MockClient()),
+    )
+    await engine.run_sync()
+
+    assert lookups == 1
+    runs = await db.list_sync_runs()
+    assert runs[0].mode == "full"
+
+
 @pytest.mark.asyncio
 async def test_get_status(db):
     """get_status should return engine state info."""
@@ -0,0 +1,103 @@
+"""Tests for the shared RateLimiter."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from spondex.sync.ratelimit import RateLimiter
+
+
+@pytest.mark.asyncio
+async def test_limit_bounds_concurrency() -> None:
+    """No more than ``concurrency`` callers hold a slot at once."""
+    limiter = RateLimiter(concurrency=2)
+    active = 0
+    peak = 0
+
+    async def call() -> None:
+        nonlocal active, peak
+        async with limiter.limit("api.example.com"):
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+
+    await asyncio.gather(*(call() for _ in range(6)))
+
+    assert peak == 2
+
+
+@pytest.mark.asyncio
+async def test_backoff_blocks_host_until_elapsed() -> None:
+    """Requests to a backed-off host wait; other hosts are unaffected."""
+    limiter = RateLimiter()
+    order: list[str] = []
+
+    async def call(host: str) -> None:
+        async with limiter.limit(host):
+            order.append(host)
+
+    backoff = asyncio.create_task(limiter.backoff("slow.example.com", 0.05))
+    await asyncio.sleep(0)
+
+    await asyncio.gather(call("slow.example.com"), call("fast.example.com"), backoff)
+
+    assert order == ["fast.example.com", "slow.example.com"]
+
+
+@pytest.mark.asyncio
+async def test_backoff_does_not_hold_slots_of_other_hosts() -> None:
+    """With every slot in use, a backed-off host must not starve other hosts."""
+    limiter = RateLimiter(concurrency=1)
+    order: list[str] = []
+
+    async def call(host: str) -> None:
+        async with limiter.limit(host):
+            order.append(host)
+
+    backoff = asyncio.create_task(limiter.backoff("slow.example.com", 0.05))
+    await asyncio.sleep(0)
+
+    slow = asyncio.create_task(call("slow.example.com"))
+    await asyncio.sleep(0)
+    await asyncio.wait_for(call("fast.example.com"), timeout=0.02)
+    await asyncio.gather(slow, backoff)
+
+    assert order == ["fast.example.com", "slow.example.com"]
+
+
+@pytest.mark.asyncio
+async def test_max_per_window_paces_request_starts() -> None:
+    """Once the window's budget is spent, the next request waits for it to roll over."""
+    limiter = RateLimiter(max_per_window=2, window=0.05)
+    loop = asyncio.get_running_loop()
+    starts: list[float] = []
+
+    async def call() -> None:
+        async with limiter.limit("api.example.com"):
+            starts.append(loop.time())
+
+    await asyncio.gather(*(call() for _ in range(3)))
+
+    assert starts[1] - starts[0] < 0.05
+    assert starts[2] - starts[0] >= 0.045
+
+
+@pytest.mark.asyncio
+async def test_paced_request_waits_without_holding_a_slot() -> None:
+    """A request waiting for window budget leaves its semaphore slot free."""
+    limiter = RateLimiter(concurrency=1, max_per_window=1, window=0.05)
+
+    async def call() -> None:
+        async with limiter.limit("api.example.com"):
+            pass
+
+    await call()
+    paced = asyncio.create_task(call())
+    await asyncio.sleep(0.01)
+
+    assert not paced.done()
+    assert not limiter._semaphore.locked()
+    await paced
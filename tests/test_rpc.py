@@ -88,6 +88,13 @@ def test_daemon_state_get_status() -> None:
     assert isinstance(status["uptime_seconds"], float)
 
 
+def test_daemon_state_uptime_ignores_wall_clock() -> None:
+    state = DaemonState()
+    # A wall-clock jump back to before the start must not produce negative uptime
+    state.started_at = state.started_at.replace(year=state.started_at.year + 1)
+    assert state.uptime_seconds() >= 0
+
+
 def test_daemon_state_request_shutdown() -> None:
     state = DaemonState()
     assert not state.shutdown_event.is_set()
@@ -102,14 +109,12 @@ def test_daemon_state_request_shutdown() -> None:
 
 def _make_client_with_scheduler() -> tuple[TestClient, DaemonState]:
     """Create a DaemonState with a mock scheduler + TestClient."""
-    from unittest.mock import MagicMock
+    from unittest.mock import create_autospec
+
+    from spondex.sync.scheduler import SyncScheduler
 
     state = DaemonState()
-    sched = MagicMock()
-    sched.trigger_now = MagicMock()
-    sched.pause = MagicMock()
-    sched.resume = MagicMock()
-    state.scheduler = sched
+    state.scheduler = create_autospec(SyncScheduler, instance=True)
     app = create_rpc_app(state)
     return TestClient(app), state
 
@@ -18,11 +18,18 @@ class MockEngine:
     """Mock SyncEngine for scheduler tests."""
 
     def __init__(self):
-        self.run_sync = AsyncMock()
+        self.synced = asyncio.Event()
+        self.run_sync = AsyncMock(side_effect=self._count_sync)
         self.sync_count = 0
 
-    async def _count_sync(self, mode=None):
+    async def _count_sync(self, mode=None, **kwargs):
         self.sync_count += 1
+        self.synced.set()
+
+    async def wait_synced(self, timeout: float = 1.0) -> None:
+        """Wait until run_sync is called, then re-arm for the next call."""
+        await asyncio.wait_for(self.synced.wait(), timeout)
+        self.synced.clear()
 
 
 # ---------------------------------------------------------------------------
@@ -50,12 +57,11 @@ async def test_trigger_now():
     sched = SyncScheduler(engine, interval_minutes=60)  # long interval
 
     await sched.start()
-    # Give scheduler a moment to enter the wait
-    await asyncio.sleep(0.05)
+    # The immediate first sync
+    await engine.wait_synced()
 
     sched.trigger_now(mode="full")
-    # Wait for sync to run
-    await asyncio.sleep(0.1)
+    await engine.wait_synced()
 
     await sched.stop()
 
@@ -73,7 +79,7 @@ async def test_pause_resume():
 
     await sched.start()
     # Wait for the immediate first sync to complete
-    await asyncio.sleep(0.1)
+    await engine.wait_synced()
     initial_call_count = engine.run_sync.call_count
 
     sched.pause()
@@ -81,7 +87,8 @@ async def test_pause_resume():
 
     # Trigger while paused — should not sync
     sched.trigger_now()
-    await asyncio.sleep(0.1)
+    with pytest.raises(TimeoutError):
+        await engine.wait_synced(timeout=0.05)
 
     assert engine.run_sync.call_count == initial_call_count
 
@@ -90,7 +97,7 @@ async def test_pause_resume():
 
     # Now trigger should work
     sched.trigger_now()
-    await asyncio.sleep(0.1)
+    await engine.wait_synced()
 
     await sched.stop()
     assert engine.run_sync.call_count > initial_call_count
@@ -127,16 +134,82 @@ async def test_double_start():
 async def test_sync_error_doesnt_crash_scheduler():
     """Scheduler should survive engine errors and keep running."""
     engine = MockEngine()
-    engine.run_sync.side_effect = RuntimeError("Boom")
+
+    async def boom(mode=None, **kwargs):
+        engine.synced.set()
+        raise RuntimeError("Boom")
+
+    engine.run_sync.side_effect = boom
 
     sched = SyncScheduler(engine, interval_minutes=60)
     await sched.start()
-    await asyncio.sleep(0.05)
+    await engine.wait_synced()
 
     sched.trigger_now()
-    await asyncio.sleep(0.1)
+    await engine.wait_synced()
 
     # Scheduler should still be running despite error
     assert sched.is_running
 
     await sched.stop()
+
+
+@pytest.mark.asyncio
+async def test_trigger_during_sync_runs_again():
+    """A trigger that arrives mid-sync should start another sync right after."""
+    started = asyncio.Event()
+    proceed = asyncio.Event()
+    engine = MockEngine()
+
+    async def slow_sync(mode=None, **kwargs):
+        started.set()
+        await proceed.wait()
+
+    engine.run_sync.side_effect = slow_sync
+
+    sched = SyncScheduler(engine, interval_minutes=60)
+    await sched.start()
+    await started.wait()
+    started.clear()
+
+    sched.trigger_now(mode="full")
+    proceed.set()
+    await asyncio.wait_for(started.wait(), 1.0)
+
+    await sched.stop()
+
+    assert engine.run_sync.call_count == 2
+    args, _ = engine.run_sync.call_args
+    assert args[0] == "full"
+
+
+@pytest.mark.asyncio
+async def test_restart_after_stop_during_sync():
+    """Restarting after a mid-sync stop should not run an extra sync."""
+    started = asyncio.Event()
+    proceed = asyncio.Event()
+    engine = MockEngine()
+
+    async def slow_sync(mode=None, **kwargs):
+        started.set()
+        await proceed.wait()
+
+    engine.run_sync.side_effect = slow_sync
+
+    sched = SyncScheduler(engine, interval_minutes=60)
+    await sched.start()
+    await started.wait()
+
+    stop_task = asyncio.create_task(sched.stop())
+    await asyncio.sleep(0)
+    proceed.set()
+    await stop_task
+
+    engine.run_sync.reset_mock()
+    engine.run_sync.side_effect = engine._count_sync
+    await sched.start()
+    await engine.wait_synced()
+    await sched.stop()
+
+    # Only the immediate first run of the restarted loop
+    assert engine.run_sync.call_count == 1
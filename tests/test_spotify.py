@@ -2,14 +2,21 @@
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import json
+import os
+import stat
+import time
 from datetime import UTC, datetime
+from pathlib import Path
 
 import httpx
 import pytest
 
 from spondex.config import SpotifyConfig
-from spondex.sync.spotify import SpotifyClient
+from spondex.sync.ratelimit import RateLimiter
+from spondex.sync.spotify import SpotifyAPIError, SpotifyClient
 
 # ---------------------------------------------------------------------------
 # Helpers
@@ -25,6 +32,10 @@ def _make_config() -> SpotifyConfig:
     )
 
 
+def _refresh_fingerprint(refresh_token: str) -> str:
+    return hashlib.sha256(refresh_token.encode()).hexdigest()[:16]
+
+
 def _token_response() -> httpx.Response:
     return httpx.Response(
         200,
@@ -37,11 +48,11 @@ def _token_response() -> httpx.Response:
     )
 
 
-def _liked_tracks_page(items: list[dict], *, has_next: bool = False) -> dict:
+def _liked_tracks_page(items: list[dict], *, has_next: bool = False, total: int | None = None) -> dict:
     return {
         "items": items,
         "next": "http://next" if has_next else None,
-        "total": len(items),
+        "total": len(items) if total is None else total,
     }
 
 
@@ -100,6 +111,133 @@ async def test_token_refresh() -> None:
     assert "token" in call_log
 
 
+@pytest.mark.asyncio
+async def test_shared_http_client_is_reused_and_left_open() -> None:
+    """An injected ``http`` client serves every request and survives ``__aexit__``."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.host == "accounts.spotify.com":
+            return _token_response()
+        return httpx.Response(200, json=_liked_tracks_page([]))
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as http:
+        for _ in range(2):
+            async with SpotifyClient(_make_config(), http=http) as client:
+                await client.get_liked_tracks()
+        assert not http.is_closed
+
+
+@pytest.mark.asyncio
+async def test_token_cache_written_after_refresh(tmp_path: Path) -> None:
+    """A refreshed token is persisted per client_id with owner-only permissions."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.host == "accounts.spotify.com":
+            return _token_response()
+        return httpx.Response(200, json=_liked_tracks_page([]))
+
+    cache = tmp_path / "token_cache.json"
+    async with SpotifyClient(_make_config(), token_cache=cache, _transport=httpx.MockTransport(handler)) as client:
+        await client.get_liked_tracks()
+
+    entry = json.loads(cache.read_text())["test-client-id"]
+    assert entry["access_token"] == "mock-access-token"
+    assert entry["expires_at"] > time.time()
+    assert entry["refresh_fingerprint"] == _refresh_fingerprint("test-refresh-token")
+    assert "test-refresh-token" not in cache.read_text()
+    assert stat.S_IMODE(os.stat(cache).st_mode) == 0o600
+
+
+@pytest.mark.asyncio
+async def test_token_cache_skips_refresh_when_fresh(tmp_path: Path) -> None:
+    """A cached, unexpired token is used without calling /api/token."""
+    token_calls = 0
+    auth_headers: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal token_calls
+        if request.url.host == "accounts.spotify.com":
+            token_calls += 1
+            return _token_response()
+        auth_headers.append(request.headers["Authorization"])
+        return httpx.Response(200, json=_liked_tracks_page([]))
+
+    cache = tmp_path / "token_cache.json"
+    cache.write_text(
+        json.dumps(
+            {
+                "test-client-id": {
+                    "access_token": "cached-token",
+                    "expires_at": time.time() + 3600,
+                    "refresh_fingerprint": _refresh_fingerprint("test-refresh-token"),
+                },
+                "other-client": {"access_token": "other-token", "expires_at": time.time() + 3600},
+            }
+        )
+    )
+    async with SpotifyClient(_make_config(), token_cache=cache, _transport=httpx.MockTransport(handler)) as client:
+        await client.get_liked_tracks()
+
+    assert token_calls == 0
+    assert auth_headers == ["Bearer cached-token"]
+
+
+@pytest.mark.asyncio
+async def test_token_cache_expired_entry_is_refreshed(tmp_path: Path) -> None:
+    """An expired (or corrupt) cache falls back to a normal refresh."""
+    token_calls = 0
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal token_calls
+        if request.url.host == "accounts.spotify.com":
+            token_calls += 1
+            return _token_response()
+        return httpx.Response(200, json=_liked_tracks_page([]))
+
+    cache = tmp_path / "token_cache.json"
+    cache.write_text(json.dumps({"test-client-id": {"access_token": "old", "expires_at": time.time() + 30}}))
+    async with SpotifyClient(_make_config(), token_cache=cache, _transport=httpx.MockTransport(handler)) as client:
+        await client.get_liked_tracks()
+
+    cache.write_text("not json")
+    async with SpotifyClient(_make_config(), token_cache=cache, _transport=httpx.MockTransport(handler)) as client:
+        await client.get_liked_tracks()
+
+    assert token_calls == 2
+    assert json.loads(cache.read_text())["test-client-id"]["access_token"] == "mock-access-token"
+
+
+@pytest.mark.asyncio
+async def test_token_cache_ignores_other_accounts_token(tmp_path: Path) -> None:
+    """A cached token minted from a different refresh token is not reused."""
+    auth_headers: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.host == "accounts.spotify.com":
+            return _token_response()
+        auth_headers.append(request.headers["Authorization"])
+        return httpx.Response(200, json=_liked_tracks_page([]))
+
+    cache = tmp_path / "token_cache.json"
+    cache.write_text(
+        json.dumps(
+            {
+                "test-client-id": {
+                    "access_token": "previous-account-token",
+                    "expires_at": time.time() + 3600,
+                    "refresh_fingerprint": _refresh_fingerprint("previous-refresh-token"),
+                }
+            }
+        )
+    )
+    async with SpotifyClient(_make_config(), token_cache=cache, _transport=httpx.MockTransport(handler)) as client:
+        await client.get_liked_tracks()
+
+    assert auth_headers == ["Bearer mock-access-token"]
+    entry = json.loads(cache.read_text())["test-client-id"]
+    assert entry["refresh_fingerprint"] == _refresh_fingerprint("test-refresh-token")
+
+
 # ---------------------------------------------------------------------------
 # get_liked_tracks pagination (2 pages)
 # ---------------------------------------------------------------------------
@@ -122,8 +260,8 @@ async def test_get_liked_tracks_pagination() -> None:
         if str(request.url).startswith("https://api.spotify.com/v1/me/tracks"):
             offset = int(request.url.params.get("offset", "0"))
             if offset == 0:
-                return httpx.Response(200, json=_liked_tracks_page(page1_items, has_next=True))
-            return httpx.Response(200, json=_liked_tracks_page(page2_items, has_next=False))
+                return httpx.Response(200, json=_liked_tracks_page(page1_items, has_next=True, total=3))
+            return httpx.Response(200, json=_liked_tracks_page(page2_items, has_next=False, total=3))
         return httpx.Response(404)
 
     transport = httpx.MockTransport(handler)
@@ -139,6 +277,28 @@ async def test_get_liked_tracks_pagination() -> None:
     assert all(t.service == "spotify" for t in tracks)
 
 
+@pytest.mark.asyncio
+async def test_get_liked_tracks_fetches_remaining_pages_from_total() -> None:
+    """Pages after the first are requested by offset from ``total`` and kept in order."""
+    requested_offsets: list[int] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.host == "accounts.spotify.com":
+            return _token_response()
+        offset = int(request.url.params["offset"])
+        requested_offsets.append(offset)
+        items = [_make_track_item(f"t{offset + i}", "Artist", f"Song {offset + i}") for i in range(50)]
+        if offset == 100:
+            items = items[:10]
+        return httpx.Response(200, json=_liked_tracks_page(items, has_next=offset < 100, total=110))
+
+    async with SpotifyClient(_make_config(), _transport=httpx.MockTransport(handler)) as client:
+        tracks = await client.get_liked_tracks()
+
+    assert sorted(requested_offsets) == [0, 50, 100]
+    assert [t.remote_id for t in tracks] == [f"t{i}" for i in range(110)]
+
+
 # ---------------------------------------------------------------------------
 # get_liked_tracks with since (early stop)
 # ---------------------------------------------------------------------------
@@ -173,6 +333,115 @@ async def test_get_liked_tracks_since_early_stop() -> None:
     assert tracks[0].remote_id == "t1"
 
 
+@pytest.mark.asyncio
+async def test_get_liked_tracks_since_prefetches_in_order() -> None:
+    """A long incremental walk prefetches later pages but returns tracks in order."""
+    requested: list[int] = []
+    pages = {
+        offset: [
+            _make_track_item(f"t{offset + i}", "Artist", f"Song {offset + i}", f"2026-02-{28 - offset // 50}T12:00:00Z")
+            for i in range(50)
+        ]
+        for offset in (0, 50, 100, 150, 200)
+    }
+    # The walk ends partway through the third page
+    pages[100][10]["added_at"] = "2026-01-01T00:00:00Z"
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.host == "accounts.spotify.com":
+            return _token_response()
+        offset = int(request.url.params["offset"])
+        requested.append(offset)
+        # Later pages answer first, to check that order comes from offsets
+        await asyncio.sleep(0.01 * (250 - offset) / 50)
+        return httpx.Response(200, json=_liked_tracks_page(pages[offset], has_next=True, total=250))
+
+    since = datetime(2026, 2, 1, tzinfo=UTC)
+    async with SpotifyClient(_make_config(), _transport=httpx.MockTransport(handler)) as client:
+        tracks = await client.get_liked_tracks(since=since)
+
+    assert [t.remote_id for t in tracks] == [f"t{i}" for i in range(110)]
+    assert requested[:1] == [0]
+    assert set(requested) <= set(pages)
+
+
+@pytest.mark.asyncio
+async def test_get_liked_tracks_since_unchanged_library_is_one_conditional_request() -> None:
+    """With nothing new, an incremental listing is a single revalidated request."""
+    requests: list[httpx.Request] = []
+    items = [_make_track_item("t1", "Artist A", "Old Song", "2026-02-10T12:00:00Z")]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.host == "accounts.spotify.com":
+            return _token_response()
+        requests.append(request)
+        if request.headers.get("If-None-Match") == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(200, json=_liked_tracks_page(items, has_next=True, total=500), headers={"ETag": '"v1"'})
+
+    cache: dict = {}
+    since = datetime(2026, 2, 15, tzinfo=UTC)
+    for _ in range(2):
+        async with SpotifyClient(_make_config(), page_cache=cache, _transport=httpx.MockTransport(handler)) as client:
+            assert await client.get_liked_tracks(since=since) == []
+
+    assert len(requests) == 2
+    assert requests[1].url.params["offset"] == "0"
+    assert requests[1].headers["If-None-Match"] == '"v1"'
+
+
+@pytest.mark.asyncio
+async def test_get_liked_tracks_revalidates_cached_pages_with_etag() -> None:
+    """A 304 for ``If-None-Match`` reuses the page decoded on the previous run."""
+    seen_etags: list[str | None] = []
+    items = [_make_track_item("t1", "Artist A", "Song One")]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.host == "accounts.spotify.com":
+            return _token_response()
+        seen_etags.append(request.headers.get("If-None-Match"))
+        if request.headers.get("If-None-Match") == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(200, json=_liked_tracks_page(items), headers={"ETag": '"v1"'})
+
+    cache: dict = {}
+    results = []
+    for _ in range(2):
+        async with SpotifyClient(_make_config(), page_cache=cache, _transport=httpx.MockTransport(handler)) as client:
+            results.append(await client.get_liked_tracks())
+
+    assert seen_etags == [None, '"v1"']
+    assert [t.remote_id for t in results[1]] == ["t1"]
+
+
+@pytest.mark.asyncio
+async def test_page_cache_drops_offsets_past_total() -> None:
+    """Cached pages hold parsed tracks, and a shrunken library evicts trailing offsets."""
+    library_size = 120
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.host == "accounts.spotify.com":
+            return _token_response()
+        offset = int(request.url.params["offset"])
+        ids = range(offset, min(offset + 50, library_size))
+        items = [_make_track_item(f"t{i}", "Artist", f"Song {i}") for i in ids]
+        page = _liked_tracks_page(items, has_next=offset + 50 < library_size, total=library_size)
+        return httpx.Response(200, json=page, headers={"ETag": f'"{library_size}-{offset}"'})
+
+    cache: dict = {}
+    async with SpotifyClient(_make_config(), page_cache=cache, _transport=httpx.MockTransport(handler)) as client:
+        await client.get_liked_tracks()
+    assert sorted(cache) == [0, 50, 100]
+    assert cache[0][1].tracks[0].remote_id == "t0"
+
+    library_size = 40
+    async with SpotifyClient(_make_config(), page_cache=cache, _transport=httpx.MockTransport(handler)) as client:
+        tracks = await client.get_liked_tracks()
+
+    assert len(tracks) == 40
+    assert sorted(cache) == [0]
+
+
 # ---------------------------------------------------------------------------
 # save_tracks batching
 # ---------------------------------------------------------------------------
@@ -206,6 +475,61 @@ async def test_save_tracks_batching() -> None:
     assert put_bodies[1]["ids"][-1] == "id74"
 
 
+@pytest.mark.asyncio
+async def test_save_tracks_batches_run_concurrently_with_one_token_refresh() -> None:
+    """Batches are sent in parallel (capped at 4) and share a single token refresh."""
+    token_calls = 0
+    in_flight = 0
+    max_in_flight = 0
+    saved: list[str] = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal token_calls, in_flight, max_in_flight
+        if request.url.host == "accounts.spotify.com":
+            token_calls += 1
+            await asyncio.sleep(0.01)
+            return _token_response()
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        saved.extend(json.loads(request.content)["ids"])
+        return httpx.Response(200)
+
+    track_ids = [f"id{i}" for i in range(250)]
+
+    async with SpotifyClient(_make_config(), _transport=httpx.MockTransport(handler)) as client:
+        await client.save_tracks(track_ids)
+
+    assert token_calls == 1
+    assert max_in_flight == 4
+    assert sorted(saved) == sorted(track_ids)
+
+
+@pytest.mark.asyncio
+async def test_save_tracks_failure_waits_for_sibling_batches() -> None:
+    """A failed batch is raised only after the other batches have settled."""
+    saved: list[str] = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.host == "accounts.spotify.com":
+            return _token_response()
+        ids = json.loads(request.content)["ids"]
+        if ids[0] == "id0":
+            return httpx.Response(400)
+        await asyncio.sleep(0.01)
+        saved.extend(ids)
+        return httpx.Response(200)
+
+    track_ids = [f"id{i}" for i in range(150)]
+
+    async with SpotifyClient(_make_config(), _transport=httpx.MockTransport(handler)) as client:
+        with pytest.raises(SpotifyAPIError):
+            await client.save_tracks(track_ids)
+
+    assert sorted(saved) == sorted(track_ids[50:])
+
+
 # ---------------------------------------------------------------------------
 # remove_tracks
 # ---------------------------------------------------------------------------
@@ -247,6 +571,7 @@ async def test_search_track_found() -> None:
         if request.url.host == "accounts.spotify.com":
             return _token_response()
         if str(request.url).startswith("https://api.spotify.com/v1/search"):
+            assert request.url.params["limit"] == "1"
             items = [_search_track_item("found1", "Daft Punk", "Get Lucky")]
             return httpx.Response(200, json=_search_response(items))
         return httpx.Response(404)
@@ -292,13 +617,13 @@ async def test_search_track_not_found() -> None:
 @pytest.mark.asyncio
 async def test_rate_limit_retry(monkeypatch: pytest.MonkeyPatch) -> None:
     """Client retries on 429 with Retry-After header."""
-    # Patch asyncio.sleep to avoid real waiting
-    sleep_calls: list[float] = []
+    # The 429 wait happens in RateLimiter.backoff; patch it to avoid real waiting
+    backoffs: list[tuple[str, float]] = []
 
-    async def fake_sleep(seconds: float) -> None:
-        sleep_calls.append(seconds)
+    async def fake_backoff(self: RateLimiter, host: str, delay: float) -> None:
+        backoffs.append((host, delay))
 
-    monkeypatch.setattr("spondex.sync.spotify.asyncio.sleep", fake_sleep)
+    monkeypatch.setattr(RateLimiter, "backoff", fake_backoff)
 
     call_count = 0
 
@@ -321,7 +646,51 @@ async def test_rate_limit_retry(monkeypatch: pytest.MonkeyPatch) -> None:
 
     assert tracks == []
     assert call_count == 2
-    assert sleep_calls == [2.0]
+    assert backoffs == [("api.spotify.com", 2)]
+
+
+@pytest.mark.asyncio
+async def test_rate_limit_holds_back_concurrent_requests(monkeypatch: pytest.MonkeyPatch) -> None:
+    """A 429 on one request delays other requests issued during the back-off."""
+    real_sleep = asyncio.sleep
+    events: list[str] = []
+    backoff_started = asyncio.Event()
+
+    async def fake_sleep(seconds: float) -> None:
+        events.append("backoff_start")
+        backoff_started.set()
+        for _ in range(5):
+            await real_sleep(0)
+        events.append("backoff_end")
+
+    monkeypatch.setattr("spondex.sync.ratelimit.asyncio.sleep", fake_sleep)
+
+    tracks_calls = 0
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal tracks_calls
+        if request.url.host == "accounts.spotify.com":
+            return _token_response()
+        if str(request.url).startswith("https://api.spotify.com/v1/me/tracks"):
+            tracks_calls += 1
+            events.append("tracks")
+            if tracks_calls == 1:
+                return httpx.Response(429, headers={"Retry-After": "2"})
+            return httpx.Response(200, json=_liked_tracks_page([]))
+        if str(request.url).startswith("https://api.spotify.com/v1/search"):
+            events.append("search")
+            return httpx.Response(200, json=_search_response([]))
+        return httpx.Response(404)
+
+    async with SpotifyClient(_make_config(), _transport=httpx.MockTransport(handler)) as client:
+
+        async def search_during_backoff() -> None:
+            await backoff_started.wait()
+            await client.search_track("Any", "Song")
+
+        await asyncio.gather(client.get_liked_tracks(), search_during_backoff())
+
+    assert events.index("search") > events.index("backoff_end")
 
 
 # ---------------------------------------------------------------------------
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
 
 import pytest
@@ -202,13 +203,14 @@ async def test_readd_removed_track_clears_removed_at(db: Database):
 
 @pytest.mark.asyncio()
 async def test_delete_removed_tracks(db: Database):
-    col = await db.create_collection(service="spotify", collection_type="liked", title="Liked")
-    tm1 = await db.upsert_track_mapping(artist="A", title="1", spotify_id="sp_1")
-    tm2 = await db.upsert_track_mapping(artist="B", title="2", spotify_id="sp_2")
+    async with db.transaction():
+        col = await db.create_collection(service="spotify", collection_type="liked", title="Liked")
+        tm1 = await db.upsert_track_mapping(artist="A", title="1", spotify_id="sp_1")
+        tm2 = await db.upsert_track_mapping(artist="B", title="2", spotify_id="sp_2")
 
-    await db.add_track_to_collection(collection_id=col.id, track_mapping_id=tm1.id)
-    await db.add_track_to_collection(collection_id=col.id, track_mapping_id=tm2.id)
-    await db.mark_track_removed(collection_id=col.id, track_mapping_id=tm1.id)
+        await db.add_track_to_collection(collection_id=col.id, track_mapping_id=tm1.id)
+        await db.add_track_to_collection(collection_id=col.id, track_mapping_id=tm2.id)
+        await db.mark_track_removed(collection_id=col.id, track_mapping_id=tm1.id)
 
     deleted = await db.delete_removed_tracks(col.id)
     assert deleted == 1
@@ -217,6 +219,28 @@ async def test_delete_removed_tracks(db: Database):
     assert len(all_tracks) == 1
 
 
+@pytest.mark.asyncio()
+async def test_load_full_sync_state(db: Database):
+    async with db.transaction():
+        sp_col = await db.create_collection(service="spotify", collection_type="liked", title="Liked")
+        ya_col = await db.create_collection(service="yandex", collection_type="liked", title="Liked")
+        both = await db.upsert_track_mapping(artist="A", title="1", spotify_id="sp_1", yandex_id="ya_1")
+        sp_only = await db.upsert_track_mapping(artist="B", title="2", spotify_id="sp_2")
+        removed = await db.upsert_track_mapping(artist="C", title="3", yandex_id="ya_3")
+
+        await db.add_track_to_collection(collection_id=sp_col.id, track_mapping_id=both.id)
+        await db.add_track_to_collection(collection_id=ya_col.id, track_mapping_id=both.id)
+        await db.add_track_to_collection(collection_id=sp_col.id, track_mapping_id=sp_only.id)
+        await db.add_track_to_collection(collection_id=ya_col.id, track_mapping_id=removed.id)
+        await db.mark_track_removed(collection_id=ya_col.id, track_mapping_id=removed.id)
+
+    state = await db.load_full_sync_state(sp_col.id, ya_col.id)
+    assert set(state.sp_id_to_mapping) == {"sp_1", "sp_2"}
+    assert set(state.ym_id_to_mapping) == {"ya_1"}
+    assert set(state.sp_collection) == {"sp_1", "sp_2"}
+    assert set(state.ym_collection) == {"ya_1"}
+
+
 # ---------------------------------------------------------------------------
 # unmatched CRUD
 # ---------------------------------------------------------------------------
@@ -300,6 +324,85 @@ async def test_list_sync_runs_ordered_desc(db: Database):
     assert runs[0].id > runs[1].id  # newest first
 
 
+# ---------------------------------------------------------------------------
+# counts
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio()
+async def test_counts(db: Database):
+    await db.upsert_track_mapping(artist="Queen", title="Bohemian Rhapsody", spotify_id="sp_1")
+    await db.upsert_track_mapping(artist="Beatles", title="Yesterday", spotify_id="sp_2")
+    await db.create_collection(service="spotify", collection_type="liked", title="Liked")
+    await db.add_unmatched(source_service="spotify", source_id="sp_x", artist="X", title="Y")
+    await db.start_sync_run(direction="bidirectional", mode="full")
+
+    assert await db.count_track_mappings() == 2
+    assert await db.count_track_mappings(search="queen") == 1
+    assert await db.count_collections() == 1
+    assert await db.count_unmatched() == 1
+    assert await db.count_sync_runs() == 1
+
+
+# ---------------------------------------------------------------------------
+# transactions
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio()
+async def test_transaction_commits_on_exit(db: Database):
+    async with db.transaction():
+        await db.upsert_track_mapping(artist="A", title="1", spotify_id="sp_1")
+        assert db.conn.in_transaction
+    assert not db.conn.in_transaction
+    assert await db.find_track_mapping(spotify_id="sp_1") is not None
+
+
+@pytest.mark.asyncio()
+async def test_transaction_rolls_back_on_error(db: Database):
+    with pytest.raises(RuntimeError):
+        async with db.transaction():
+            await db.upsert_track_mapping(artist="A", title="1", spotify_id="sp_1")
+            raise RuntimeError("boom")
+    assert await db.find_track_mapping(spotify_id="sp_1") is None
+
+
+@pytest.mark.asyncio()
+async def test_nested_transaction_rolls_back_to_savepoint(db: Database):
+    async with db.transaction():
+        await db.upsert_track_mapping(artist="A", title="1", spotify_id="sp_1")
+        with pytest.raises(RuntimeError):
+            async with db.transaction():
+                await db.upsert_track_mapping(artist="B", title="2", spotify_id="sp_2")
+                raise RuntimeError("boom")
+    assert await db.find_track_mapping(spotify_id="sp_1") is not None
+    assert await db.find_track_mapping(spotify_id="sp_2") is None
+
+
+@pytest.mark.asyncio()
+async def test_other_task_does_not_join_open_transaction(db: Database):
+    """A write from another task waits for the transaction instead of joining it."""
+    go = asyncio.Event()
+
+    async def other_writer():
+        await go.wait()
+        await db.upsert_track_mapping(artist="B", title="2", spotify_id="sp_2")
+
+    other = asyncio.create_task(other_writer())
+    with pytest.raises(RuntimeError):
+        async with db.transaction():
+            await db.upsert_track_mapping(artist="A", title="1", spotify_id="sp_1")
+            go.set()
+            for _ in range(5):
+                await asyncio.sleep(0)
+            assert not other.done()
+            raise RuntimeError("boom")
+    await other
+
+    assert await db.find_track_mapping(spotify_id="sp_1") is None
+    assert await db.find_track_mapping(spotify_id="sp_2") is not None
+
+
 # ---------------------------------------------------------------------------
 # Round-trip / integration
 # ---------------------------------------------------------------------------
@@ -308,34 +411,35 @@ async def test_list_sync_runs_ordered_desc(db: Database):
 @pytest.mark.asyncio()
 async def test_full_sync_scenario(db: Database):
     """Simulate a real liked-tracks sync: create collections, map tracks, sync."""
-    # 1. Create paired liked collections
-    sp_liked = await db.create_collection(service="spotify", collection_type="liked", title="Liked Songs")
-    ya_liked = await db.create_collection(service="yandex", collection_type="liked", title="Мне нравится")
-    await db.pair_collections(sp_liked.id, ya_liked.id)
-
-    # 2. Start sync run
+    # 1. Start sync run
     run = await db.start_sync_run(direction="bidirectional", mode="full")
 
-    # 3. Map a track found on both platforms
-    tm = await db.upsert_track_mapping(
-        artist="Radiohead",
-        title="Creep",
-        spotify_id="sp_creep",
-        yandex_id="ya_creep",
-        match_confidence=0.95,
-    )
-
-    # 4. Add to both collections
-    await db.add_track_to_collection(collection_id=sp_liked.id, track_mapping_id=tm.id, position=0)
-    await db.add_track_to_collection(collection_id=ya_liked.id, track_mapping_id=tm.id, position=0)
-
-    # 5. Track we couldn't find on Yandex
-    await db.add_unmatched(
-        source_service="spotify",
-        source_id="sp_rare",
-        artist="Obscure Band",
-        title="Rare Song",
-    )
+    async with db.transaction():
+        # 2. Create paired liked collections
+        sp_liked = await db.create_collection(service="spotify", collection_type="liked", title="Liked Songs")
+        ya_liked = await db.create_collection(service="yandex", collection_type="liked", title="Мне нравится")
+        await db.pair_collections(sp_liked.id, ya_liked.id)
+
+        # 3. Map a track found on both platforms
+        tm = await db.upsert_track_mapping(
+            artist="Radiohead",
+            title="Creep",
+            spotify_id="sp_creep",
+            yandex_id="ya_creep",
+            match_confidence=0.95,
+        )
+
+        # 4. Add to both collections
+        await db.add_track_to_collection(collection_id=sp_liked.id, track_mapping_id=tm.id, position=0)
+        await db.add_track_to_collection(collection_id=ya_liked.id, track_mapping_id=tm.id, position=0)
+
+        # 5. Track we couldn't find on Yandex
+        await db.add_unmatched(
+            source_service="spotify",
+            source_id="sp_rare",
+            artist="Obscure Band",
+            title="Rare Song",
+        )
 
     # 6. Finish sync
     stats = json.dumps({"added": 1, "unmatched": 1})
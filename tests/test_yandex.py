@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from datetime import UTC, datetime
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -24,22 +25,21 @@ def _make_mock_client() -> MagicMock:
     return mock_client
 
 
-def _make_track_short(track_id: str, timestamp: str | None = None) -> MagicMock:
-    ts = MagicMock()
-    ts.track_id = track_id
-    ts.timestamp = timestamp
-    return ts
+# Plain data holders: unlike MagicMock, reading an attribute the real
+# yandex_music objects don't have raises instead of returning a mock.
 
 
-def _make_full_track(track_id: str, title: str, artist_name: str, duration_ms: int | None = None) -> MagicMock:
-    track = MagicMock()
-    track.id = track_id
-    track.title = title
-    track.duration_ms = duration_ms
-    artist = MagicMock()
-    artist.name = artist_name
-    track.artists = [artist]
-    return track
+def _make_track_short(track_id: str, timestamp: str | None = None) -> SimpleNamespace:
+    return SimpleNamespace(track_id=track_id, timestamp=timestamp)
+
+
+def _make_full_track(track_id: str, title: str, artist_name: str, duration_ms: int | None = None) -> SimpleNamespace:
+    return SimpleNamespace(
+        id=track_id,
+        title=title,
+        duration_ms=duration_ms,
+        artists=[SimpleNamespace(name=artist_name)],
+    )
 
 
 @pytest.mark.asyncio
@@ -76,6 +76,22 @@ async def test_get_liked_tracks() -> None:
     )
 
 
+@pytest.mark.asyncio
+async def test_get_liked_tracks_fetches_batches_in_order() -> None:
+    """Full tracks are fetched in batches of 100 and flattened in like order."""
+    mock_client = _make_mock_client()
+    ids = [str(i) for i in range(250)]
+    mock_client.users_likes_tracks.return_value = [_make_track_short(tid) for tid in ids]
+    mock_client.tracks.side_effect = lambda batch: [_make_full_track(tid, f"Song {tid}", "Artist") for tid in batch]
+
+    with patch("yandex_music.Client", return_value=mock_client):
+        async with YandexClient(_make_config()) as yc:
+            tracks = await yc.get_liked_tracks()
+
+    assert sorted(len(call.args[0]) for call in mock_client.tracks.call_args_list) == [50, 100, 100]
+    assert [t.remote_id for t in tracks] == ids
+
+
 @pytest.mark.asyncio
 async def test_get_liked_tracks_since_filters_by_timestamp() -> None:
     """get_liked_tracks with since filters out older tracks."""
@@ -131,12 +147,8 @@ async def test_search_track_returns_match() -> None:
     """search_track returns a RemoteTrack when a best match is found."""
     mock_client = _make_mock_client()
 
-    best = MagicMock()
-    best.type = "track"
-    best.result = _make_full_track("999", "Found Song", "Found Artist")
-
-    search_result = MagicMock()
-    search_result.best = best
+    best = SimpleNamespace(type="track", result=_make_full_track("999", "Found Song", "Found Artist"))
+    search_result = SimpleNamespace(best=best)
     mock_client.search.return_value = search_result
 
     with patch("yandex_music.Client", return_value=mock_client):
@@ -158,8 +170,7 @@ async def test_search_track_returns_none_when_not_found() -> None:
     """search_track returns None when no best match exists."""
     mock_client = _make_mock_client()
 
-    search_result = MagicMock()
-    search_result.best = None
+    search_result = SimpleNamespace(best=None)
     mock_client.search.return_value = search_result
 
     with patch("yandex_music.Client", return_value=mock_client):
@@ -169,6 +180,31 @@ async def test_search_track_returns_none_when_not_found() -> None:
     assert track is None
 
 
+@pytest.mark.asyncio
+async def test_rate_limited_call_backs_off_and_retries(monkeypatch: pytest.MonkeyPatch) -> None:
+    """A 429 surfaced as NetworkError is retried after an exponential back-off."""
+    from yandex_music.exceptions import NetworkError
+
+    sleep_calls: list[float] = []
+
+    async def fake_sleep(seconds: float) -> None:
+        sleep_calls.append(seconds)
+
+    monkeypatch.setattr("spondex.sync.ratelimit.asyncio.sleep", fake_sleep)
+
+    mock_client = _make_mock_client()
+    search_result = SimpleNamespace(best=None)
+    mock_client.search.side_effect = [NetworkError("Too many requests (429): b''"), search_result]
+
+    with patch("yandex_music.Client", return_value=mock_client):
+        async with YandexClient(_make_config()) as yc:
+            track = await yc.search_track("Nobody", "No Song")
+
+    assert track is None
+    assert mock_client.search.call_count == 2
+    assert sleep_calls == [1]
+
+
 # ---------------------------------------------------------------------------
 # Auth error contains actionable message
 # ---------------------------------------------------------------------------
@@ -185,3 +221,38 @@ async def test_auth_error_contains_config_set_hint() -> None:
     ):
         async with YandexClient(_make_config()):
             pass
+
+
+@pytest.mark.asyncio
+async def test_known_account_uid_skips_init() -> None:
+    """With an account uid from a previous session, init() is not called."""
+    mock_client = _make_mock_client()
+    mock_client.account_uid = 42
+    mock_client.users_likes_tracks.return_value = []
+
+    with patch("yandex_music.Client", return_value=mock_client):
+        async with YandexClient(_make_config()) as first:
+            pass
+        assert first.account_uid == 42
+        mock_client.init.reset_mock()
+
+        async with YandexClient(_make_config(), account_uid=first.account_uid) as yc:
+            await yc.get_liked_tracks()
+
+    mock_client.init.assert_not_called()
+    assert mock_client.account_uid == 42
+
+
+@pytest.mark.asyncio
+async def test_unauthorized_without_init_raises_auth_error() -> None:
+    """A revoked token surfaces as YandexAuthError even when init() was skipped."""
+    from yandex_music.exceptions import UnauthorizedError
+
+    from spondex.sync.yandex import YandexAuthError
+
+    mock_client = _make_mock_client()
+    mock_client.users_likes_tracks.side_effect = UnauthorizedError("unauthorized")
+
+    with patch("yandex_music.Client", return_value=mock_client), pytest.raises(YandexAuthError, match="config set"):
+        async with YandexClient(_make_config(), account_uid=42) as yc:
+            await yc.get_liked_tracks()